@@ -0,0 +1,25 @@
+-- Batch rule insertion RPC
+-- Inserts many rules in a single round trip; the function body runs in one transaction
+
+CREATE OR REPLACE FUNCTION insert_rules_tx(rows JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    INSERT INTO rules (
+        rule_id, project_id, title, guidance, rationale,
+        category, priority, contexts, tech_stacks, keywords, embedding
+    )
+    SELECT
+        r.rule_id, r.project_id, r.title, r.guidance, r.rationale,
+        r.category, COALESCE(r.priority, 'medium'),
+        COALESCE(r.contexts, '{}'), COALESCE(r.tech_stacks, '{}'), COALESCE(r.keywords, '{}'),
+        r.embedding
+    FROM jsonb_populate_recordset(NULL::rules, rows) AS r;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$;
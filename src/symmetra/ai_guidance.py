@@ -6,17 +6,156 @@ combined with vector-based rule retrieval. The focus is on giving Claude Code
 excellent architectural advice based on team-specific rules when needed.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 import logging
+import re
+import sys
 
 # Import vector search engine
 from symmetra.vector_search import vector_search_engine
+from symmetra.keyword_matcher import KeywordMatcher
+from symmetra.code_scan import CodeScan, scan_code
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses (smaller, faster attribute access) need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+_COMPLEXITY_INDICATORS = (
+    'microservice', 'distributed', 'async', 'concurrent',
+    'authentication', 'authorization', 'security',
+    'database', 'transaction', 'migration',
+    'performance', 'optimization', 'scaling'
+)
+
+# Every keyword group the engine looks for in an action, matched in one scan
+_ACTION_MATCHER = KeywordMatcher({
+    # Fallback guidance topics
+    "auth": ('auth', 'login', 'user', 'password', 'jwt', 'token'),
+    "database": ('database', 'db', 'sql', 'data'),
+    "api": ('api', 'endpoint', 'rest', 'graphql'),
+    "performance": ('performance', 'optimize', 'cache', 'speed'),
+    "security": ('security', 'secure', 'protection'),
+    "architecture": ('architecture', 'design', 'structure', 'organize'),
+    # Pattern suggestions
+    "patterns:auth": ('auth',),
+    "patterns:api": ('api',),
+    "patterns:database": ('database',),
+    "patterns:large": ('large', 'complex', 'enterprise'),
+    "patterns:cache": ('cache',),
+    # Complexity indicators, counted individually
+    **{f"complexity:{indicator}": (indicator,) for indicator in _COMPLEXITY_INDICATORS},
+})
+
+# Fallback guidance per action topic (shared, never mutated)
+_AUTH_GUIDANCE = (
+    "🔐 **Authentication Implementation:**",
+    "• Use bcrypt/Argon2 for password hashing",
+    "• Implement JWT with proper secret management (RS256 preferred)",
+    "• Add rate limiting to prevent brute force attacks",
+    "• Use HTTPS everywhere for auth endpoints",
+    "• Consider OAuth 2.0 for third-party integrations",
+    "",
+    "⚠️ **Note**: For comprehensive implementation guides, ensure your team's",
+    "authentication patterns are stored in the Symmetra vector database.",
+    "This fallback provides basic guidance only."
+)
+
+_DATABASE_GUIDANCE = (
+    "🗄️ For database architecture:",
+    "• Use connection pooling for better performance",
+    "• Implement proper indexing strategy",
+    "• Use parameterized queries to prevent SQL injection",
+    "• Consider read replicas for high-traffic applications",
+    "• Plan for database migrations and schema versioning"
+)
+
+_API_GUIDANCE = (
+    "🌐 For API design:",
+    "• Follow RESTful conventions or GraphQL best practices",
+    "• Implement proper error handling and status codes",
+    "• Add request/response validation",
+    "• Use API versioning strategy",
+    "• Consider rate limiting and authentication",
+    "• Document your API with OpenAPI/Swagger"
+)
+
+_PERFORMANCE_GUIDANCE = (
+    "⚡ For performance optimization:",
+    "• Profile before optimizing - measure actual bottlenecks",
+    "• Implement caching at appropriate layers (Redis, CDN)",
+    "• Use database query optimization and indexing",
+    "• Consider asynchronous processing for heavy operations",
+    "• Implement pagination for large data sets"
+)
+
+_SECURITY_GUIDANCE = (
+    "🛡️ For security implementation:",
+    "• Follow OWASP Top 10 security guidelines",
+    "• Implement input validation and sanitization",
+    "• Use HTTPS everywhere and secure headers",
+    "• Apply principle of least privilege",
+    "• Regular security audits and dependency updates",
+    "• Never commit secrets to version control"
+)
+
+_ARCHITECTURE_GUIDANCE = (
+    "🏗️ For architectural design:",
+    "• Follow SOLID principles and clean architecture",
+    "• Separate concerns into focused modules",
+    "• Use dependency injection for better testability",
+    "• Consider microservices vs monolith trade-offs",
+    "• Plan for scalability and maintainability",
+    "• Document architectural decisions and rationale"
+)
+
+_DEFAULT_GUIDANCE = (
+    "🎯 General architectural guidance:",
+    "• Keep it simple - avoid over-engineering",
+    "• Write tests for critical functionality",
+    "• Use established patterns and libraries",
+    "• Consider maintainability and future changes",
+    "• Document important decisions and assumptions"
+)
+
+_UNAVAILABLE_GUIDANCE = ("Unable to generate guidance at this time",)
+
+# Suggested architectural patterns per action keyword
+_AUTH_PATTERNS = ("JWT Token Pattern", "OAuth 2.0", "Session Management")
+_API_PATTERNS = ("REST API", "Repository Pattern", "DTO Pattern")
+_DATABASE_PATTERNS = ("Repository Pattern", "Unit of Work", "Active Record")
+_LARGE_SYSTEM_PATTERNS = ("Microservices", "CQRS", "Event Sourcing")
+_CACHE_PATTERNS = ("Cache-Aside", "Write-Through Cache", "Cache Abstraction")
+
+# Dispatch tables, in priority order: the first matching category supplies the
+# fallback guidance, while every matching pattern category contributes patterns
+_ACTION_GUIDANCE = (
+    ("auth", _AUTH_GUIDANCE),
+    ("database", _DATABASE_GUIDANCE),
+    ("api", _API_GUIDANCE),
+    ("performance", _PERFORMANCE_GUIDANCE),
+    ("security", _SECURITY_GUIDANCE),
+    ("architecture", _ARCHITECTURE_GUIDANCE),
+)
+_ACTION_PATTERNS = (
+    ("patterns:auth", _AUTH_PATTERNS),
+    ("patterns:api", _API_PATTERNS),
+    ("patterns:database", _DATABASE_PATTERNS),
+    ("patterns:large", _LARGE_SYSTEM_PATTERNS),
+    ("patterns:cache", _CACHE_PATTERNS),
+)
+
+_COMPLEXITY_LEVELS = ("low", "medium", "high")
+
+_PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+_CATEGORY_EMOJI = {
+    "architecture": "🏗️", "security": "🔒", "performance": "⚡", 
+    "ai-ml": "🧠", "devops": "🚀", "testing": "🧪"
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class GuidanceResponse:
     """Response from AI architectural guidance analysis"""
     guidance: List[str]
@@ -27,6 +166,7 @@ class GuidanceResponse:
     rules_applied: List[str] = None  # Which rules were used
     code_analysis: Dict[str, Any] = None  # Code analysis metadata
     external_resources: List[Dict[str, str]] = None  # External URLs for fresh documentation
+    degraded: bool = False  # Built-in fallback served because rule search failed (not cacheable)
     
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -75,37 +215,36 @@ class AIGuidanceEngine:
             GuidanceResponse with AI-generated architectural guidance
         """
         try:
+            # Lowercase and scan the action and code once; every check reads these
+            hits = _ACTION_MATCHER.match(action.lower())
+            scan = scan_code(code) if code else None
+            
             # Use vector search to find relevant rules
+            relevant_rules = []
             if vector_search_engine.is_available():
-                guidance = self._get_vector_guidance(action, code, context, project_id)
+                guidance, relevant_rules, degraded = self._get_vector_guidance(
+                    action, context, hits, project_id, scan
+                )
             else:
                 # Fallback to hardcoded guidance if vector search unavailable
                 self.logger.warning("Vector search unavailable, using fallback guidance")
-                guidance = self._analyze_action(action, code, context)
+                guidance = self._analyze_action(hits, scan)
+                degraded = True
             
-            complexity = self._assess_complexity(action, code)
-            patterns = self._suggest_patterns(action, context)
+            complexity = self._assess_complexity(hits, scan)
+            patterns = self._suggest_patterns(hits)
             
-            # Collect metadata for response
-            rules_applied = []
+            # Collect metadata for response from the rules vector search applied
+            rules_applied = [rule['title'] for rule in relevant_rules]
             external_resources = []
-            if vector_search_engine.is_available() and guidance != self._analyze_action(action, code, context):
-                # We used vector search, extract rule names and external URLs
-                try:
-                    relevant_rules = vector_search_engine.search_rules(f"{action} {context}".strip(), project_id=project_id, limit=3)
-                    rules_applied = [rule['title'] for rule in relevant_rules]
-                    
-                    # Collect external resources from all relevant rules
-                    for rule in relevant_rules:
-                        if rule.get('external_urls'):
-                            for key, url in rule['external_urls'].items():
-                                external_resources.append({
-                                    "title": key.replace("_", " ").title(),
-                                    "url": url,
-                                    "why": f"For latest {key.replace('_', ' ')}"
-                                })
-                except:
-                    pass
+            for rule in relevant_rules:
+                if rule.get('external_urls'):
+                    for key, url in rule['external_urls'].items():
+                        external_resources.append({
+                            "title": key.replace("_", " ").title(),
+                            "url": url,
+                            "why": f"For latest {key.replace('_', ' ')}"
+                        })
             
             return GuidanceResponse(
                 guidance=guidance,
@@ -116,33 +255,39 @@ class AIGuidanceEngine:
                 rules_applied=rules_applied,
                 external_resources=external_resources if external_resources else None,
                 code_analysis={
-                    "lines_analyzed": len(code.split('\n')) if code else 0,
+                    "lines_analyzed": scan.line_count if scan else 0,
                     "context_provided": bool(context),
                     "rules_matched": len(rules_applied)
-                }
+                },
+                degraded=degraded
             )
             
         except Exception as e:
             self.logger.error(f"Error generating guidance: {e}")
             return GuidanceResponse(
-                guidance=["Unable to generate guidance at this time"],
+                guidance=list(_UNAVAILABLE_GUIDANCE),
                 status="advisory", 
                 action=action,
-                complexity_score="unknown"
+                complexity_score="unknown",
+                degraded=True
             )
     
-    def _get_vector_guidance(self, action: str, code: str, context: str, project_id: str = None) -> List[str]:
+    def _get_vector_guidance(self, action: str, context: str, hits: Set[str], project_id: str = None,
+                             scan: Optional[CodeScan] = None) -> Tuple[List[str], List[Dict[str, Any]], bool]:
         """
         Get guidance using vector search of rules database
         
         Args:
             action: What the user wants to do
-            code: Optional existing code
             context: Optional project context
+            hits: Keyword categories matched in the action (for fallback guidance)
             project_id: Optional project ID for team-specific rules
+            scan: Code-smell facts for the optional existing code
             
         Returns:
-            List of guidance strings synthesized from relevant rules
+            Guidance strings synthesized from relevant rules, the rules
+            applied (empty when falling back to built-in guidance), and
+            whether the search failed so the fallback stands in for it
         """
         try:
             # Search for relevant rules
@@ -152,7 +297,7 @@ class AIGuidanceEngine:
             if not relevant_rules:
                 # No relevant rules found, use fallback
                 self.logger.info("No relevant rules found, using fallback guidance")
-                return self._analyze_action(action, code, context)
+                return self._analyze_action(hits, scan), [], False
             
             # Synthesize guidance from relevant rules
             guidance = []
@@ -164,11 +309,8 @@ class AIGuidanceEngine:
             
             # Add guidance from each relevant rule
             for rule in relevant_rules:
-                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(rule['priority'], "⚪")
-                category_emoji = {
-                    "architecture": "🏗️", "security": "🔒", "performance": "⚡", 
-                    "ai-ml": "🧠", "devops": "🚀", "testing": "🧪"
-                }.get(rule['category'], "📋")
+                priority_emoji = _PRIORITY_EMOJI.get(rule['priority'], "⚪")
+                category_emoji = _CATEGORY_EMOJI.get(rule['category'], "📋")
                 
                 guidance.append(f"{priority_emoji} {category_emoji} **{rule['title']}**")
                 guidance.append(rule['guidance'])
@@ -179,174 +321,73 @@ class AIGuidanceEngine:
                 guidance.append("")
             
             # Add code-specific analysis if code provided
-            if code:
-                code_guidance = self._analyze_code_structure(code)
+            if scan:
+                code_guidance = self._analyze_code_structure(scan)
                 if code_guidance:
                     guidance.append("📄 **Code Analysis:**")
                     guidance.extend(code_guidance)
             
-            return guidance
+            return guidance, relevant_rules, False
             
         except Exception as e:
             self.logger.error(f"Vector guidance failed: {e}")
             # Fallback to hardcoded guidance
-            return self._analyze_action(action, code, context)
+            return self._analyze_action(hits, scan), [], True
     
-    def _analyze_action(self, action: str, code: str, context: str) -> List[str]:
+    def _analyze_action(self, hits: Set[str], scan: Optional[CodeScan] = None) -> List[str]:
         """Analyze the action and provide contextual guidance"""
         guidance = []
-        action_lower = action.lower()
         
-        # Authentication guidance - Minimal fallback (detailed guides should be in vector DB)
-        if any(word in action_lower for word in ['auth', 'login', 'user', 'password', 'jwt', 'token']):
-            guidance.extend([
-                "🔐 **Authentication Implementation:**",
-                "• Use bcrypt/Argon2 for password hashing",
-                "• Implement JWT with proper secret management (RS256 preferred)",
-                "• Add rate limiting to prevent brute force attacks",
-                "• Use HTTPS everywhere for auth endpoints",
-                "• Consider OAuth 2.0 for third-party integrations",
-                "",
-                "⚠️ **Note**: For comprehensive implementation guides, ensure your team's",
-                "authentication patterns are stored in the Symmetra vector database.",
-                "This fallback provides basic guidance only."
-            ])
-            
-        # Database guidance  
-        elif any(word in action_lower for word in ['database', 'db', 'sql', 'data']):
-            guidance.extend([
-                "🗄️ For database architecture:",
-                "• Use connection pooling for better performance",
-                "• Implement proper indexing strategy", 
-                "• Use parameterized queries to prevent SQL injection",
-                "• Consider read replicas for high-traffic applications",
-                "• Plan for database migrations and schema versioning"
-            ])
-            
-        # API guidance
-        elif any(word in action_lower for word in ['api', 'endpoint', 'rest', 'graphql']):
-            guidance.extend([
-                "🌐 For API design:",
-                "• Follow RESTful conventions or GraphQL best practices",
-                "• Implement proper error handling and status codes",
-                "• Add request/response validation",
-                "• Use API versioning strategy",
-                "• Consider rate limiting and authentication",
-                "• Document your API with OpenAPI/Swagger"
-            ])
-            
-        # Performance guidance
-        elif any(word in action_lower for word in ['performance', 'optimize', 'cache', 'speed']):
-            guidance.extend([
-                "⚡ For performance optimization:",
-                "• Profile before optimizing - measure actual bottlenecks",
-                "• Implement caching at appropriate layers (Redis, CDN)",
-                "• Use database query optimization and indexing",
-                "• Consider asynchronous processing for heavy operations",
-                "• Implement pagination for large data sets"
-            ])
-            
-        # Security guidance
-        elif any(word in action_lower for word in ['security', 'secure', 'protection']):
-            guidance.extend([
-                "🛡️ For security implementation:",
-                "• Follow OWASP Top 10 security guidelines", 
-                "• Implement input validation and sanitization",
-                "• Use HTTPS everywhere and secure headers",
-                "• Apply principle of least privilege",
-                "• Regular security audits and dependency updates",
-                "• Never commit secrets to version control"
-            ])
-            
-        # Architecture guidance
-        elif any(word in action_lower for word in ['architecture', 'design', 'structure', 'organize']):
-            guidance.extend([
-                "🏗️ For architectural design:",
-                "• Follow SOLID principles and clean architecture",
-                "• Separate concerns into focused modules",
-                "• Use dependency injection for better testability", 
-                "• Consider microservices vs monolith trade-offs",
-                "• Plan for scalability and maintainability",
-                "• Document architectural decisions and rationale"
-            ])
+        # Minimal fallback for the highest-priority topic (detailed guides should be in vector DB)
+        for category, category_guidance in _ACTION_GUIDANCE:
+            if category in hits:
+                guidance.extend(category_guidance)
+                break
             
         # Code analysis guidance
-        if code:
-            code_guidance = self._analyze_code_structure(code)
-            guidance.extend(code_guidance)
+        if scan:
+            guidance.extend(self._analyze_code_structure(scan))
             
         # Default guidance if no specific pattern matched
         if not guidance:
-            guidance.extend([
-                "🎯 General architectural guidance:",
-                "• Keep it simple - avoid over-engineering",
-                "• Write tests for critical functionality",
-                "• Use established patterns and libraries",
-                "• Consider maintainability and future changes",
-                "• Document important decisions and assumptions"
-            ])
+            guidance = list(_DEFAULT_GUIDANCE)
             
         return guidance
     
-    def _analyze_code_structure(self, code: str) -> List[str]:
+    def _analyze_code_structure(self, scan: CodeScan) -> List[str]:
         """Analyze existing code and provide improvement suggestions"""
         guidance = []
-        lines = code.split('\n')
         
         # Basic code analysis
-        if len(lines) > 100:
+        if scan.line_count > 100:
             guidance.append("📄 Consider breaking large files into smaller, focused modules")
             
-        if 'TODO' in code or 'FIXME' in code:
+        if scan.has_todo:
             guidance.append("📝 Address TODO/FIXME comments before production")
             
-        if 'password' in code.lower() and any(char in code for char in ['"', "'"]):
+        if scan.possible_hardcoded_password:
             guidance.append("⚠️ Potential hardcoded credentials detected - use environment variables")
             
         return guidance
     
-    def _assess_complexity(self, action: str, code: str) -> str:
+    def _assess_complexity(self, hits: Set[str], scan: Optional[CodeScan] = None) -> str:
         """Assess the complexity of the action/code"""
-        complexity_indicators = [
-            'microservice', 'distributed', 'async', 'concurrent',
-            'authentication', 'authorization', 'security',
-            'database', 'transaction', 'migration',
-            'performance', 'optimization', 'scaling'
-        ]
-        
-        action_lower = action.lower()
-        matches = sum(1 for indicator in complexity_indicators if indicator in action_lower)
+        matches = sum(1 for hit in hits if hit.startswith("complexity:"))
         
-        if code and len(code.split('\n')) > 100:
+        if scan and scan.line_count > 100:
             matches += 1
-            
-        if matches >= 3:
-            return "high"
-        elif matches >= 1:
-            return "medium"
-        else:
-            return "low"
+        
+        # One indicator makes it medium, three make it high
+        return _COMPLEXITY_LEVELS[(matches >= 1) + (matches >= 3)]
     
-    def _suggest_patterns(self, action: str, context: str) -> List[str]:
+    def _suggest_patterns(self, hits: Set[str]) -> List[str]:
         """Suggest relevant architectural patterns"""
         patterns = []
-        action_lower = action.lower()
-        context_lower = context.lower()
-        
-        if 'auth' in action_lower:
-            patterns.extend(["JWT Token Pattern", "OAuth 2.0", "Session Management"])
-            
-        if 'api' in action_lower:
-            patterns.extend(["REST API", "Repository Pattern", "DTO Pattern"])
-            
-        if 'database' in action_lower:
-            patterns.extend(["Repository Pattern", "Unit of Work", "Active Record"])
-            
-        if any(word in action_lower for word in ['large', 'complex', 'enterprise']):
-            patterns.extend(["Microservices", "CQRS", "Event Sourcing"])
-            
-        if 'cache' in action_lower:
-            patterns.extend(["Cache-Aside", "Write-Through Cache", "Cache Abstraction"])
+        for category, category_patterns in _ACTION_PATTERNS:
+            if category in hits:
+                patterns.extend(category_patterns)
+                if len(patterns) >= 3:
+                    break
             
         return patterns[:3]  # Limit to top 3 suggestions
 
@@ -363,16 +404,22 @@ class SimpleSecretDetector:
         r'github[_-]?token["\']?\s*[:=]\s*["\']ghp_[^"\']+["\']',
     ]
     
+    # Compiled once; a line can only match if the whole code does, so the
+    # combined pattern lets clean code skip the per-line scan entirely
+    _SECRET_REGEXES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in SECRET_PATTERNS)
+    _ANY_SECRET = re.compile("|".join(f"(?:{pattern})" for pattern in SECRET_PATTERNS), re.IGNORECASE)
+    
     def scan_secrets(self, code: str) -> List[Dict[str, Any]]:
         """Scan for potential hardcoded secrets"""
-        import re
-        
         secrets = []
+        if not self._ANY_SECRET.search(code):
+            return secrets
+        
         lines = code.split('\n')
         
         for line_num, line in enumerate(lines, 1):
-            for pattern in self.SECRET_PATTERNS:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern in self._SECRET_REGEXES:
+                if pattern.search(line):
                     secrets.append({
                         "type": "hardcoded_secret",
                         "line": line_num,
@@ -5,8 +5,54 @@ Provides intelligent context extraction for better analysis and
 understanding of detected issues within their surrounding code.
 """
 
+import re
 from typing import List, Dict, Any, Tuple, Optional
 
+# Comment prefixes per language (tuples, so one str.startswith call checks them all)
+_C_STYLE_COMMENT_PREFIXES = ('//', '/*', '*')
+_COMMENT_PREFIXES = {
+    'python': ('#',),
+    'javascript': _C_STYLE_COMMENT_PREFIXES,
+    'typescript': _C_STYLE_COMMENT_PREFIXES,
+    'java': _C_STYLE_COMMENT_PREFIXES,
+    'csharp': _C_STYLE_COMMENT_PREFIXES,
+    'cpp': _C_STYLE_COMMENT_PREFIXES,
+    'c': _C_STYLE_COMMENT_PREFIXES,
+    'php': ('//', '/*', '*', '#'),
+    'ruby': ('#',),
+    'go': _C_STYLE_COMMENT_PREFIXES,
+    'rust': _C_STYLE_COMMENT_PREFIXES,
+    'swift': _C_STYLE_COMMENT_PREFIXES
+}
+_ANY_COMMENT_PREFIXES = ('//', '/*', '*', '#')
+_FALLBACK_COMMENT_PREFIXES = ('//', '#')
+
+# Lines that start a function, per language; compiled at import so no call
+# pays for compiling (or looking up) them
+_JS_FUNCTION_STARTS = [
+    re.compile(r'^\s*function\s+'),
+    re.compile(r'^\s*const\s+\w+\s*='),
+    re.compile(r'^\s*\w+\s*\(.*\)\s*=>'),
+    re.compile(r'^\s*\w+\s*:\s*function'),
+]
+_C_FAMILY_FUNCTION_STARTS = [
+    re.compile(r'^\s*(?:public|private|protected)?\s*(?:static\s+)?(?:\w+\s+)*\w+\s*\('),
+]
+_FUNCTION_START_PATTERNS = {
+    'python': [re.compile(r'^\s*def\s+')],
+    'javascript': _JS_FUNCTION_STARTS,
+    'typescript': _JS_FUNCTION_STARTS,
+    'java': _C_FAMILY_FUNCTION_STARTS,
+    'csharp': _C_FAMILY_FUNCTION_STARTS
+}
+
+# Name extraction for function and class context lines
+_PYTHON_FUNCTION_NAME = re.compile(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+_CLASS_NAME = re.compile(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+_JS_FUNCTION_NAME = re.compile(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+_JS_VARIABLE_NAME = re.compile(r'(?:const|let|var)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=')
+_JS_METHOD_NAME = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+
 
 class ContextExtractor:
     """Extract and format code context around detected issues"""
@@ -39,13 +85,16 @@ class ContextExtractor:
         Returns:
             Dictionary with context information
         """
-        lines = code.split('\n')
-        total_lines = len(lines)
+        total_lines = code.count('\n') + 1
         
         # Calculate context boundaries
         start_line = max(0, line_number - self.context_radius - 1)
         end_line = min(total_lines, line_number + self.context_radius)
         
+        # Split off only the lines up to the window's end; the rest of the
+        # code stays one string instead of becoming a str per line
+        lines = code.split('\n', max(end_line, 0))
+        
         # Extract context lines
         context_lines = []
         for i in range(start_line, end_line):
@@ -80,32 +129,17 @@ class ContextExtractor:
     
     def _is_comment_line(self, line: str, language: Optional[str]) -> bool:
         """Check if a line is a comment"""
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             return False
         
-        comment_patterns = {
-            'python': ['#'],
-            'javascript': ['//', '/*', '*'],
-            'typescript': ['//', '/*', '*'],
-            'java': ['//', '/*', '*'],
-            'csharp': ['//', '/*', '*'],
-            'cpp': ['//', '/*', '*'],
-            'c': ['//', '/*', '*'],
-            'php': ['//', '/*', '*', '#'],
-            'ruby': ['#'],
-            'go': ['//', '/*', '*'],
-            'rust': ['//', '/*', '*'],
-            'swift': ['//', '/*', '*']
-        }
-        
         if not language:
             # Check for common comment patterns
-            patterns = ['//', '/*', '*', '#']
+            prefixes = _ANY_COMMENT_PREFIXES
         else:
-            patterns = comment_patterns.get(language.lower(), ['//', '#'])
+            prefixes = _COMMENT_PREFIXES.get(language.lower(), _FALLBACK_COMMENT_PREFIXES)
         
-        stripped = line.strip()
-        return any(stripped.startswith(pattern) for pattern in patterns)
+        return stripped.startswith(prefixes)
     
     def _analyze_context_structure(
         self, 
@@ -181,32 +215,28 @@ class ContextExtractor:
     
     def _extract_python_function_name(self, line: str) -> str:
         """Extract function name from Python def line"""
-        import re
-        match = re.search(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)', line)
+        match = _PYTHON_FUNCTION_NAME.search(line)
         return match.group(1) if match else 'unknown'
     
     def _extract_python_class_name(self, line: str) -> str:
         """Extract class name from Python class line"""
-        import re
-        match = re.search(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)', line)
+        match = _CLASS_NAME.search(line)
         return match.group(1) if match else 'unknown'
     
     def _extract_js_function_name(self, line: str) -> Optional[str]:
         """Extract function name from JavaScript/TypeScript"""
-        import re
-        
         # function declaration
-        match = re.search(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)', line)
+        match = _JS_FUNCTION_NAME.search(line)
         if match:
             return match.group(1)
         
         # const/let/var function
-        match = re.search(r'(?:const|let|var)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=', line)
+        match = _JS_VARIABLE_NAME.search(line)
         if match:
             return match.group(1)
         
         # method definition
-        match = re.search(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', line)
+        match = _JS_METHOD_NAME.search(line)
         if match and '=>' not in line:
             return match.group(1)
         
@@ -214,8 +244,7 @@ class ContextExtractor:
     
     def _extract_js_class_name(self, line: str) -> Optional[str]:
         """Extract class name from JavaScript/TypeScript"""
-        import re
-        match = re.search(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)', line)
+        match = _CLASS_NAME.search(line)
         return match.group(1) if match else None
     
     def _highlight_keywords(self, context_lines: List[Dict[str, Any]], keywords: List[str]):
@@ -330,25 +359,15 @@ class ContextExtractor:
         if not language:
             return None
         
-        function_patterns = {
-            'python': [r'^\s*def\s+'],
-            'javascript': [r'^\s*function\s+', r'^\s*const\s+\w+\s*=', r'^\s*\w+\s*\(.*\)\s*=>', r'^\s*\w+\s*:\s*function'],
-            'typescript': [r'^\s*function\s+', r'^\s*const\s+\w+\s*=', r'^\s*\w+\s*\(.*\)\s*=>', r'^\s*\w+\s*:\s*function'],
-            'java': [r'^\s*(?:public|private|protected)?\s*(?:static\s+)?(?:\w+\s+)*\w+\s*\('],
-            'csharp': [r'^\s*(?:public|private|protected)?\s*(?:static\s+)?(?:\w+\s+)*\w+\s*\(']
-        }
-        
-        patterns = function_patterns.get(language.lower(), [])
+        patterns = _FUNCTION_START_PATTERNS.get(language.lower(), [])
         if not patterns:
             return None
         
-        import re
-        
         # Search backwards from current line
         for i in range(current_line, -1, -1):
             line = lines[i]
             for pattern in patterns:
-                if re.match(pattern, line):
+                if pattern.match(line):
                     return i
         
         return None
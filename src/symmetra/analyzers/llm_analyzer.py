@@ -489,7 +489,7 @@ class LLMAnalyzer:
         if code_context.count('try:') > 1:
             indicators.append("Multiple error handling blocks")
         
-        if len(code_context.split('\n')) > 50:
+        if code_context.count('\n') + 1 > 50:
             indicators.append("High line count")
         
         return indicators if indicators else ["General complexity"]
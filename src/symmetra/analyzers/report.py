@@ -9,6 +9,11 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from ..detectors.base import DetectedIssue, DetectionResult, Severity
 
+# Issue type groupings (exact type values, so hashed membership is enough)
+_SECURITY_ISSUE_TYPES = frozenset({'hardcoded_secret', 'sql_injection_risk', 'insecure_protocol'})
+_MAINTAINABILITY_ISSUE_TYPES = frozenset({'large_file', 'large_function', 'duplicate_code'})
+_PERFORMANCE_ISSUE_TYPES = frozenset({'deep_nesting', 'large_function'})
+
 
 class ReportGenerator:
     """Generate formatted reports from analysis results"""
@@ -183,7 +188,7 @@ class ReportGenerator:
         
         security_issues = [
             issue for issue in result.issues 
-            if issue.type.value in ['hardcoded_secret', 'sql_injection_risk', 'insecure_protocol']
+            if issue.type.value in _SECURITY_ISSUE_TYPES
         ]
         
         report = {
@@ -391,7 +396,7 @@ class ReportGenerator:
         """Assess security posture"""
         security_issues = [
             i for i in result.issues 
-            if i.type.value in ['hardcoded_secret', 'sql_injection_risk', 'insecure_protocol']
+            if i.type.value in _SECURITY_ISSUE_TYPES
         ]
         
         critical_security = len([i for i in security_issues if i.severity == Severity.CRITICAL])
@@ -527,14 +532,14 @@ class ReportGenerator:
             "user_impact": "None"
         }
         
-        if issue.type.value in ['hardcoded_secret', 'sql_injection_risk', 'insecure_protocol']:
+        if issue.type.value in _SECURITY_ISSUE_TYPES:
             impact_analysis["security_impact"] = "High" if issue.severity == Severity.CRITICAL else "Medium"
             impact_analysis["user_impact"] = "High"
         
-        if issue.type.value in ['large_file', 'large_function', 'duplicate_code']:
+        if issue.type.value in _MAINTAINABILITY_ISSUE_TYPES:
             impact_analysis["maintainability_impact"] = "High"
         
-        if issue.type.value in ['deep_nesting', 'large_function']:
+        if issue.type.value in _PERFORMANCE_ISSUE_TYPES:
             impact_analysis["performance_impact"] = "Low"
         
         return impact_analysis
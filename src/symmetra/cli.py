@@ -148,6 +148,7 @@ def config_command(args) -> None:
         print(f"\n🌐 Current settings:")
         print(f"   HTTP Host: {SymmetraConfig.get_http_host()}")
         print(f"   HTTP Port: {SymmetraConfig.get_http_port()}")
+        print(f"   HTTP Workers: {SymmetraConfig.get_http_workers()}")
         print(f"   Log Level: {SymmetraConfig.get_log_level()}")
         print(f"   Max File Lines: {SymmetraConfig.get_max_file_lines()}")
         print(f"   Complexity Threshold: {SymmetraConfig.get_complexity_threshold()}")
@@ -171,6 +172,7 @@ auto_format_suggestions = true
 http_host = "0.0.0.0"
 http_port = 8080
 http_path = "/mcp"
+http_workers = 1
 
 [rules]
 max_file_lines = 300
@@ -337,6 +339,7 @@ For uvx usage:
     http_parser = subparsers.add_parser("http", help="Start HTTP server")
     http_parser.add_argument("--host", default=SymmetraConfig.get_http_host(), help="Host to bind to")
     http_parser.add_argument("--port", type=int, default=SymmetraConfig.get_http_port(), help="Port to bind to")
+    http_parser.add_argument("--workers", type=int, default=SymmetraConfig.get_http_workers(), help="Number of worker processes (above 1, MCP sessions are served statelessly since they are not shared between workers)")
     
     args = parser.parse_args()
     
@@ -365,7 +368,7 @@ For uvx usage:
     elif args.command == "http":
         # Import and run HTTP server with args
         from .http_server import main as http_main
-        http_main(host=args.host, port=args.port)
+        http_main(host=args.host, port=args.port, workers=args.workers)
     else:
         parser.print_help()
         sys.exit(1)
@@ -384,9 +387,10 @@ def http_main_cli() -> None:
     parser = argparse.ArgumentParser(description="Symmetra HTTP Server")
     parser.add_argument("--host", default=SymmetraConfig.get_http_host(), help="Host to bind to")
     parser.add_argument("--port", type=int, default=SymmetraConfig.get_http_port(), help="Port to bind to")
+    parser.add_argument("--workers", type=int, default=SymmetraConfig.get_http_workers(), help="Number of worker processes (above 1, MCP sessions are served statelessly since they are not shared between workers)")
     
     args = parser.parse_args()
-    http_main(host=args.host, port=args.port)
+    http_main(host=args.host, port=args.port, workers=args.workers)
 
 
 if __name__ == "__main__":
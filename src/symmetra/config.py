@@ -132,6 +132,12 @@ class SymmetraConfig:
         """Get HTTP server path."""
         return cls.get_config_value("server", "http_path", "/mcp", "SYMMETRA_HTTP_PATH")
     
+    @classmethod
+    def get_http_workers(cls) -> int:
+        """Get number of HTTP worker processes."""
+        workers = cls.get_config_value("server", "http_workers", 1, "SYMMETRA_HTTP_WORKERS")
+        return max(1, int(workers))
+    
     @classmethod
     def get_log_level(cls) -> str:
         """Get logging level."""
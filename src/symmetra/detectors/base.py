@@ -6,9 +6,18 @@ and data structures for issue reporting.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from hashlib import blake2b
+from threading import Lock
 from typing import List, Dict, Any, Optional
 from enum import Enum
+import ast
+import sys
+
+
+# Slotted dataclasses (smaller, faster attribute access) need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class Severity(Enum):
@@ -33,7 +42,7 @@ class IssueType(Enum):
     DUPLICATE_CODE = "duplicate_code"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DetectedIssue:
     """Represents a specific issue found in code"""
     
@@ -63,6 +72,10 @@ class DetectedIssue:
     pattern_matched: Optional[str] = None
     matched_text: Optional[str] = None
     
+    # Plain-str copies of type.value and severity.value for serialization loops
+    type_value: str = field(init=False, repr=False, compare=False)
+    severity_value: str = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate the issue after creation"""
         if not 0.0 <= self.confidence <= 1.0:
@@ -70,6 +83,9 @@ class DetectedIssue:
         
         if self.line_number < 1:
             raise ValueError(f"Line number must be >= 1, got {self.line_number}")
+        
+        self.type_value = self.type.value
+        self.severity_value = self.severity.value
     
     @property
     def is_critical(self) -> bool:
@@ -84,8 +100,8 @@ class DetectedIssue:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
-            "type": self.type.value,
-            "severity": self.severity.value,
+            "type": self.type_value,
+            "severity": self.severity_value,
             "rule_id": self.rule_id,
             "file_path": self.file_path,
             "line_number": self.line_number,
@@ -116,6 +132,7 @@ class DetectionResult:
     
     # Detection statistics
     detectors_run: List[str] = field(default_factory=list)
+    detectors_failed: List[str] = field(default_factory=list)  # raised instead of finishing
     patterns_checked: int = 0
     
     # Status and guidance
@@ -138,7 +155,7 @@ class DetectionResult:
         """Count issues by severity"""
         counts = {severity.value: 0 for severity in Severity}
         for issue in self.issues:
-            counts[issue.severity.value] += 1
+            counts[issue.severity_value] += 1
         return counts
     
     @property
@@ -155,6 +172,7 @@ class DetectionResult:
             "analysis_time_ms": self.analysis_time_ms,
             "issues": [issue.to_dict() for issue in self.issues],
             "detectors_run": self.detectors_run,
+            "detectors_failed": self.detectors_failed,
             "patterns_checked": self.patterns_checked,
             "status": self.status,
             "guidance": self.guidance,
@@ -164,6 +182,35 @@ class DetectionResult:
         }
 
 
+# Recently parsed Python trees, keyed on a digest of the source so large
+# snippets are not kept alive as keys; oldest entries are evicted first
+_PARSE_CACHE_SIZE = 64
+_parse_cache: "OrderedDict[bytes, ast.AST]" = OrderedDict()
+_parse_cache_lock = Lock()
+
+
+def parse_python(code: str) -> ast.AST:
+    """Parse Python source, reusing the tree when the same code was parsed recently
+    
+    Several detectors (and repeat tool calls on the same snippet) parse the
+    same source; they share one tree, which callers must treat as read-only.
+    Raises SyntaxError like ast.parse (failures are not cached).
+    """
+    key = blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _parse_cache_lock:
+        tree = _parse_cache.get(key)
+        if tree is not None:
+            _parse_cache.move_to_end(key)
+            return tree
+    
+    tree = ast.parse(code)
+    with _parse_cache_lock:
+        _parse_cache[key] = tree
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return tree
+
+
 class Detector(ABC):
     """Base class for all Symmetra detectors"""
     
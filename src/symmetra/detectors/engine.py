@@ -12,9 +12,37 @@ Architecture:
 """
 
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from .base import Detector, DetectedIssue, DetectionResult, Severity
 
+# File extension (lowercase, with the dot) -> language
+_EXTENSION_LANGUAGES = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cs': 'csharp',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.go': 'go',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.rs': 'rust',
+    '.scala': 'scala',
+    '.clj': 'clojure',
+    '.sh': 'bash',
+    '.ps1': 'powershell'
+}
+
+# Blank code with fewer lines than this is not worth running detectors on
+# (the smallest size check needs hundreds of lines)
+_BLANK_CODE_MAX_LINES = 100
 
 class DetectionEngine:
     """Main engine for running code detection analysis"""
@@ -22,6 +50,7 @@ class DetectionEngine:
     def __init__(self, detectors: List[Detector]):
         self.detectors = detectors
         self.total_patterns_checked = 0
+        self.blank_inputs_skipped = 0
     
     def analyze_code(self, code: str, file_path: str, context: Optional[Dict[str, Any]] = None) -> DetectionResult:
         """
@@ -34,6 +63,9 @@ class DetectionEngine:
             
         Returns:
             DetectionResult with all issues found and guidance
+        
+        Detectors are not run on blank code (whitespace only, under 100
+        lines); the result is a clean analysis with no detectors run.
         """
         if context is None:
             context = {}
@@ -44,7 +76,7 @@ class DetectionEngine:
         result = DetectionResult(
             file_path=file_path,
             language=context.get('language'),
-            total_lines=len(code.split('\n'))
+            total_lines=code.count('\n') + 1
         )
         
         # Detect language if not provided
@@ -55,24 +87,35 @@ class DetectionEngine:
         # Run all applicable detectors
         all_issues = []
         detectors_run = []
+        detectors_failed = []
         
-        for detector in self.detectors:
-            if detector.should_run(file_path, result.language, context):
-                try:
-                    detector_issues = detector.detect(code, file_path, context)
-                    all_issues.extend(detector_issues)
-                    detectors_run.append(detector.name)
-                    
-                    # Count patterns checked
-                    patterns = detector.get_detection_patterns()
-                    self.total_patterns_checked += len(patterns)
-                    
-                except Exception as e:
-                    # Log detector error but continue with other detectors
-                    print(f"Warning: {detector.name} failed: {e}")
+        if result.total_lines < _BLANK_CODE_MAX_LINES and not code.strip():
+            # Agents often sanity-check empty snippets; there is nothing to inspect
+            self.blank_inputs_skipped += 1
+            detectors = []
+        else:
+            detectors = [
+                detector for detector in self.detectors
+                if detector.should_run(file_path, result.language, context)
+            ]
+        outcomes = self._run_detectors(detectors, code, file_path, context)
+        for detector, outcome in zip(detectors, outcomes):
+            if isinstance(outcome, Exception):
+                # Log detector error but continue with other detectors
+                print(f"Warning: {detector.name} failed: {outcome}")
+                detectors_failed.append(detector.name)
+                continue
+            
+            all_issues.extend(outcome)
+            detectors_run.append(detector.name)
+            
+            # Count patterns checked
+            patterns = detector.get_detection_patterns()
+            self.total_patterns_checked += len(patterns)
         
         # Store analysis metadata
         result.detectors_run = detectors_run
+        result.detectors_failed = detectors_failed
         result.patterns_checked = self.total_patterns_checked
         result.analysis_time_ms = (time.time() - start_time) * 1000
         
@@ -90,42 +133,30 @@ class DetectionEngine:
         
         return result
     
+    def _run_detectors(self, detectors: List[Detector], code: str, file_path: str,
+                       context: Dict[str, Any]) -> List[Union[List[DetectedIssue], Exception]]:
+        """Run each detector on the code, returning its issues or the exception it raised
+        
+        Outcomes are returned in detector order.
+        """
+        outcomes = []
+        for detector in detectors:
+            try:
+                outcomes.append(detector.detect(code, file_path, context))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
     def _detect_language(self, file_path: str, code: str) -> Optional[str]:
         """Detect programming language from file extension and content"""
-        file_lower = file_path.lower()
-        
-        # File extension mapping
-        extension_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.cs': 'csharp',
-            '.php': 'php',
-            '.rb': 'ruby',
-            '.go': 'go',
-            '.cpp': 'cpp',
-            '.c': 'c',
-            '.h': 'c',
-            '.hpp': 'cpp',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.rs': 'rust',
-            '.scala': 'scala',
-            '.clj': 'clojure',
-            '.sh': 'bash',
-            '.ps1': 'powershell'
-        }
-        
-        for ext, lang in extension_map.items():
-            if file_path.endswith(ext):
-                return lang
+        # Everything from the last dot is the extension (also for dotfiles like ".py")
+        dot = file_path.rfind('.')
+        if dot >= 0:
+            language = _EXTENSION_LANGUAGES.get(file_path[dot:].lower())
+            if language:
+                return language
         
         # Content-based detection fallbacks
-        code_lower = code.lower()
-        
         if 'def ' in code and 'import ' in code:
             return 'python'
         elif 'function ' in code and ('var ' in code or 'let ' in code or 'const ' in code):
@@ -342,6 +373,7 @@ class DetectionEngine:
             "enabled_detectors": len(enabled_detectors),
             "detector_names": [d.name for d in enabled_detectors],
             "total_patterns_checked": self.total_patterns_checked,
+            "blank_inputs_skipped": self.blank_inputs_skipped,
             "supported_languages": list(set(
                 lang for detector in enabled_detectors 
                 for lang in detector.get_supported_languages()
@@ -16,7 +16,48 @@ import re
 import ast
 from typing import List, Dict, Any, Set, Tuple
 from collections import defaultdict, Counter
-from .base import Detector, DetectedIssue, IssueType, Severity
+from .base import Detector, DetectedIssue, IssueType, Severity, parse_python
+
+
+# Language-specific error handling patterns, compiled once
+_ERROR_PATTERNS = {
+    language: {kind: [re.compile(pattern) for pattern in patterns] for kind, patterns in kinds.items()}
+    for language, kinds in {
+        'python': {
+            'risky_operations': [
+                r'open\s*\(',
+                r'requests\.(get|post|put|delete)',
+                r'json\.loads\s*\(',
+                r'int\s*\(',
+                r'float\s*\(',
+            ],
+            'error_handling': [
+                r'try\s*:',
+                r'except\s+',
+                r'raise\s+',
+            ]
+        },
+        'javascript': {
+            'risky_operations': [
+                r'JSON\.parse\s*\(',
+                r'fetch\s*\(',
+                r'parseInt\s*\(',
+                r'parseFloat\s*\(',
+            ],
+            'error_handling': [
+                r'try\s*{',
+                r'catch\s*\(',
+                r'throw\s+',
+            ]
+        }
+    }.items()
+}
+
+_WHITESPACE_RUN = re.compile(r'\s+')
+_SNAKE_CASE_NAME = re.compile(r'^[a-z_][a-z0-9_]*$')
+_PASCAL_CASE_NAME = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
+_LOOSE_EQUALITY = re.compile(r'[^=!]==[^=]')
+_TODO_MARKER = re.compile(r'\b(TODO|FIXME|HACK|XXX)\b', re.IGNORECASE)
 
 
 class PatternDetector(Detector):
@@ -27,6 +68,7 @@ class PatternDetector(Detector):
         
         # Magic number patterns (excluding common acceptable values)
         self.magic_number_pattern = r'\b(?<![\w.])((?!0|1|2|10|100|1000)\d{2,})\b'
+        self._magic_number_regex = re.compile(self.magic_number_pattern)
         self.acceptable_numbers = {0, 1, 2, 3, 4, 5, 10, 24, 60, 100, 200, 404, 500, 1000, 1024}
         
         # Duplication threshold
@@ -38,62 +80,33 @@ class PatternDetector(Detector):
         issues = []
         language = context.get('language', '').lower()
         
+        # The line-based checks scan the same lines; split them once
+        lines = code.split('\n')
+        
         # Check for missing error handling
-        issues.extend(self._check_error_handling(code, file_path, language))
+        issues.extend(self._check_error_handling(lines, file_path, language))
         
         # Check for magic numbers
-        issues.extend(self._check_magic_numbers(code, file_path, language))
+        issues.extend(self._check_magic_numbers(lines, file_path, language))
         
         # Check for code duplication
-        issues.extend(self._check_code_duplication(code, file_path, language))
+        issues.extend(self._check_code_duplication(lines, file_path, language))
         
         # Language-specific patterns
         if language == 'python':
             issues.extend(self._check_python_patterns(code, file_path))
         elif language in ['javascript', 'typescript']:
-            issues.extend(self._check_javascript_patterns(code, file_path))
+            issues.extend(self._check_javascript_patterns(lines, file_path))
         else:
-            issues.extend(self._check_generic_patterns(code, file_path, language))
+            issues.extend(self._check_generic_patterns(lines, file_path, language))
         
         return issues
     
-    def _check_error_handling(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _check_error_handling(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Check for missing or inadequate error handling"""
         issues = []
-        lines = code.split('\n')
         
-        # Language-specific error handling patterns
-        error_patterns = {
-            'python': {
-                'risky_operations': [
-                    r'open\s*\(',
-                    r'requests\.(get|post|put|delete)',
-                    r'json\.loads\s*\(',
-                    r'int\s*\(',
-                    r'float\s*\(',
-                ],
-                'error_handling': [
-                    r'try\s*:',
-                    r'except\s+',
-                    r'raise\s+',
-                ]
-            },
-            'javascript': {
-                'risky_operations': [
-                    r'JSON\.parse\s*\(',
-                    r'fetch\s*\(',
-                    r'parseInt\s*\(',
-                    r'parseFloat\s*\(',
-                ],
-                'error_handling': [
-                    r'try\s*{',
-                    r'catch\s*\(',
-                    r'throw\s+',
-                ]
-            }
-        }
-        
-        lang_patterns = error_patterns.get(language, error_patterns.get('javascript', {}))
+        lang_patterns = _ERROR_PATTERNS.get(language, _ERROR_PATTERNS.get('javascript', {}))
         if not lang_patterns:
             return issues
         
@@ -108,12 +121,12 @@ class PatternDetector(Detector):
             
             # Check for risky operations
             for pattern in lang_patterns.get('risky_operations', []):
-                if re.search(pattern, line):
-                    risky_lines.append((line_no, line.strip(), pattern))
+                if pattern.search(line):
+                    risky_lines.append((line_no, line.strip(), pattern.pattern))
             
             # Check for error handling
             for pattern in lang_patterns.get('error_handling', []):
-                if re.search(pattern, line):
+                if pattern.search(line):
                     error_handling_lines.add(line_no)
         
         # Find risky operations without nearby error handling
@@ -169,17 +182,16 @@ class PatternDetector(Detector):
         }
         return suggestions.get(language, "Add appropriate error handling")
     
-    def _check_magic_numbers(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _check_magic_numbers(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Check for magic numbers that should be constants"""
         issues = []
-        lines = code.split('\n')
         
         for line_no, line in enumerate(lines, 1):
             if self._is_comment_line(line, language):
                 continue
             
             # Find potential magic numbers
-            numbers = re.finditer(self.magic_number_pattern, line)
+            numbers = self._magic_number_regex.finditer(line)
             for match in numbers:
                 number = int(match.group(1))
                 
@@ -229,10 +241,9 @@ class PatternDetector(Detector):
         
         return False
     
-    def _check_code_duplication(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _check_code_duplication(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Check for duplicated code blocks"""
         issues = []
-        lines = code.split('\n')
         
         # Normalize lines (remove whitespace and comments)
         normalized_lines = []
@@ -241,7 +252,7 @@ class PatternDetector(Detector):
                 normalized_lines.append("")
             else:
                 # Normalize whitespace
-                normalized = re.sub(r'\s+', ' ', line.strip())
+                normalized = _WHITESPACE_RUN.sub(' ', line.strip())
                 normalized_lines.append(normalized)
         
         # Find duplicate blocks
@@ -297,7 +308,7 @@ class PatternDetector(Detector):
         issues = []
         
         try:
-            tree = ast.parse(code)
+            tree = parse_python(code)
             issues.extend(self._check_python_unused_imports(tree, file_path))
             issues.extend(self._check_python_naming_conventions(tree, file_path))
             issues.extend(self._check_python_antipatterns(tree, file_path))
@@ -358,7 +369,7 @@ class PatternDetector(Detector):
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef):
                 # Function names should be snake_case
-                if not re.match(r'^[a-z_][a-z0-9_]*$', node.name) and not node.name.startswith('_'):
+                if not _SNAKE_CASE_NAME.match(node.name) and not node.name.startswith('_'):
                     issues.append(DetectedIssue(
                         type=IssueType.DUPLICATE_CODE,  # Reusing enum
                         severity=Severity.LOW,
@@ -375,7 +386,7 @@ class PatternDetector(Detector):
             
             elif isinstance(node, ast.ClassDef):
                 # Class names should be PascalCase
-                if not re.match(r'^[A-Z][a-zA-Z0-9]*$', node.name):
+                if not _PASCAL_CASE_NAME.match(node.name):
                     issues.append(DetectedIssue(
                         type=IssueType.DUPLICATE_CODE,  # Reusing enum
                         severity=Severity.LOW,
@@ -431,10 +442,9 @@ class PatternDetector(Detector):
         
         return issues
     
-    def _check_javascript_patterns(self, code: str, file_path: str) -> List[DetectedIssue]:
+    def _check_javascript_patterns(self, lines: List[str], file_path: str) -> List[DetectedIssue]:
         """Check JavaScript/TypeScript specific patterns"""
         issues = []
-        lines = code.split('\n')
         
         # Check for console.log in production code
         for line_no, line in enumerate(lines, 1):
@@ -455,7 +465,7 @@ class PatternDetector(Detector):
         
         # Check for == instead of ===
         for line_no, line in enumerate(lines, 1):
-            if re.search(r'[^=!]==[^=]', line) and not self._is_comment_line(line, 'javascript'):
+            if _LOOSE_EQUALITY.search(line) and not self._is_comment_line(line, 'javascript'):
                 issues.append(DetectedIssue(
                     type=IssueType.DUPLICATE_CODE,  # Reusing enum
                     severity=Severity.LOW,
@@ -472,10 +482,9 @@ class PatternDetector(Detector):
         
         return issues
     
-    def _check_generic_patterns(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _check_generic_patterns(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Check generic patterns for any language"""
         issues = []
-        lines = code.split('\n')
         
         # Check for very long lines
         for line_no, line in enumerate(lines, 1):
@@ -496,7 +505,7 @@ class PatternDetector(Detector):
         
         # Check for TODO/FIXME comments
         for line_no, line in enumerate(lines, 1):
-            if re.search(r'\b(TODO|FIXME|HACK|XXX)\b', line, re.IGNORECASE):
+            if _TODO_MARKER.search(line):
                 issues.append(DetectedIssue(
                     type=IssueType.DUPLICATE_CODE,  # Reusing enum
                     severity=Severity.LOW,
@@ -18,6 +18,24 @@ from typing import List, Dict, Any, Tuple, Optional
 from .base import Detector, DetectedIssue, IssueType, Severity
 
 
+def _compile_patterns(patterns: List[Tuple[str, str, float]]) -> List[Tuple["re.Pattern", str, float]]:
+    """Compile (pattern, type, confidence) rows once; all security patterns ignore case"""
+    return [(re.compile(pattern, re.IGNORECASE), kind, confidence) for pattern, kind, confidence in patterns]
+
+
+# Suspicious authentication patterns
+_AUTH_BYPASS_PATTERNS = _compile_patterns([
+    # Always true conditions
+    (r'if\s+True\s*:', "always_true_auth", 0.70),
+    # Debug mode bypasses
+    (r'if\s+debug\s*:', "debug_bypass", 0.60),
+    # Comment out auth
+    (r'#.*auth|//.*auth', "commented_auth", 0.50),
+    # Hardcoded admin checks
+    (r'user.*==.*["\']admin["\']', "hardcoded_admin", 0.75),
+])
+
+
 class SecurityDetector(Detector):
     """Security vulnerability detection"""
     
@@ -94,6 +112,12 @@ class SecurityDetector(Detector):
             # Hardcoded encryption keys
             (r'key\s*=\s*["\'][a-zA-Z0-9/+=]{16,}["\']', "hardcoded_crypto_key", 0.70),
         ]
+        
+        # Compiled once per detector; the scans below run them on every line
+        self._secret_regexes = _compile_patterns(self.secret_patterns)
+        self._sql_injection_regexes = _compile_patterns(self.sql_injection_patterns)
+        self._protocol_regexes = _compile_patterns(self.protocol_patterns)
+        self._crypto_regexes = _compile_patterns(self.crypto_patterns)
     
     def detect(self, code: str, file_path: str, context: Dict[str, Any]) -> List[DetectedIssue]:
         """Detect security issues in code"""
@@ -104,20 +128,23 @@ class SecurityDetector(Detector):
         if self._is_test_or_doc_file(file_path):
             return issues
         
+        # Every check scans the same lines; split them once
+        lines = code.split('\n')
+        
         # Detect hardcoded secrets
-        issues.extend(self._detect_secrets(code, file_path, language))
+        issues.extend(self._detect_secrets(lines, file_path, language))
         
         # Detect SQL injection risks
-        issues.extend(self._detect_sql_injection(code, file_path, language))
+        issues.extend(self._detect_sql_injection(lines, file_path, language))
         
         # Detect insecure protocols
-        issues.extend(self._detect_insecure_protocols(code, file_path, context))
+        issues.extend(self._detect_insecure_protocols(lines, file_path, context))
         
         # Detect weak cryptography
-        issues.extend(self._detect_weak_crypto(code, file_path, language))
+        issues.extend(self._detect_weak_crypto(lines, file_path, language))
         
         # Detect authentication bypasses
-        issues.extend(self._detect_auth_bypasses(code, file_path, language))
+        issues.extend(self._detect_auth_bypasses(lines, file_path, language))
         
         # Deduplicate issues on the same line  
         return self._deduplicate_issues(issues)
@@ -133,18 +160,17 @@ class SecurityDetector(Detector):
         ]
         return any(indicator in path_lower for indicator in test_indicators)
     
-    def _detect_secrets(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _detect_secrets(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Detect hardcoded secrets and credentials"""
         issues = []
-        lines = code.split('\n')
         
         for line_num, line in enumerate(lines, 1):
             # Skip comments and strings that are clearly examples
             if self._is_comment_or_example(line):
                 continue
             
-            for pattern, secret_type, confidence in self.secret_patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
+            for pattern, secret_type, confidence in self._secret_regexes:
+                matches = pattern.finditer(line)
                 for match in matches:
                     # Additional validation for high-entropy strings
                     if secret_type == "high_entropy_string":
@@ -169,7 +195,7 @@ class SecurityDetector(Detector):
                         fix_suggestion=self._get_secret_fix_suggestion(secret_type),
                         confidence=confidence,
                         language=language,
-                        pattern_matched=pattern,
+                        pattern_matched=pattern.pattern,
                         matched_text=match.group(0)[:50]  # Truncate for safety
                     ))
         
@@ -273,10 +299,9 @@ class SecurityDetector(Detector):
         
         return fix_suggestions.get(secret_type, "Move sensitive value to environment variable")
     
-    def _detect_sql_injection(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _detect_sql_injection(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Detect SQL injection vulnerabilities"""
         issues = []
-        lines = code.split('\n')
         
         for line_num, line in enumerate(lines, 1):
             # Skip comments
@@ -287,8 +312,8 @@ class SecurityDetector(Detector):
             if not any(keyword in line.upper() for keyword in ['SELECT', 'INSERT', 'UPDATE', 'DELETE', 'DROP', 'CREATE']):
                 continue
             
-            for pattern, injection_type, confidence in self.sql_injection_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern, injection_type, confidence in self._sql_injection_regexes:
+                if pattern.search(line):
                     issues.append(DetectedIssue(
                         type=IssueType.SQL_INJECTION_RISK,
                         severity=Severity.HIGH,
@@ -300,24 +325,23 @@ class SecurityDetector(Detector):
                         fix_suggestion="Use parameterized queries or ORM methods",
                         confidence=confidence,
                         language=language,
-                        pattern_matched=pattern,
+                        pattern_matched=pattern.pattern,
                         matched_text=line.strip()[:100]
                     ))
         
         return issues
     
-    def _detect_insecure_protocols(self, code: str, file_path: str, context: Dict[str, Any]) -> List[DetectedIssue]:
+    def _detect_insecure_protocols(self, lines: List[str], file_path: str, context: Dict[str, Any]) -> List[DetectedIssue]:
         """Detect usage of insecure protocols"""
         issues = []
-        lines = code.split('\n')
         environment = context.get('environment', 'unknown').lower()
         
         for line_num, line in enumerate(lines, 1):
             if self._is_comment_or_example(line):
                 continue
             
-            for pattern, protocol_type, base_confidence in self.protocol_patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
+            for pattern, protocol_type, base_confidence in self._protocol_regexes:
+                matches = pattern.finditer(line)
                 for match in matches:
                     # Adjust confidence based on context
                     confidence = base_confidence
@@ -343,7 +367,7 @@ class SecurityDetector(Detector):
                             message=f"Usage of insecure {protocol_type.replace('_', ' ')}",
                             fix_suggestion=self._get_protocol_fix_suggestion(protocol_type),
                             confidence=confidence,
-                            pattern_matched=pattern,
+                            pattern_matched=pattern.pattern,
                             matched_text=match.group(0)
                         ))
         
@@ -383,17 +407,16 @@ class SecurityDetector(Detector):
         
         return deduplicated
     
-    def _detect_weak_crypto(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _detect_weak_crypto(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Detect weak cryptographic practices"""
         issues = []
-        lines = code.split('\n')
         
         for line_num, line in enumerate(lines, 1):
             if self._is_comment_or_example(line):
                 continue
             
-            for pattern, crypto_type, confidence in self.crypto_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern, crypto_type, confidence in self._crypto_regexes:
+                if pattern.search(line):
                     severity = Severity.HIGH if confidence > 0.8 else Severity.MEDIUM
                     
                     issues.append(DetectedIssue(
@@ -407,7 +430,7 @@ class SecurityDetector(Detector):
                         fix_suggestion=self._get_crypto_fix_suggestion(crypto_type),
                         confidence=confidence,
                         language=language,
-                        pattern_matched=pattern,
+                        pattern_matched=pattern.pattern,
                         matched_text=line.strip()[:100]
                     ))
         
@@ -423,22 +446,9 @@ class SecurityDetector(Detector):
         }
         return suggestions.get(crypto_type, "Use modern, secure cryptographic methods")
     
-    def _detect_auth_bypasses(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
+    def _detect_auth_bypasses(self, lines: List[str], file_path: str, language: str) -> List[DetectedIssue]:
         """Detect potential authentication bypasses"""
         issues = []
-        lines = code.split('\n')
-        
-        # Look for suspicious authentication patterns
-        auth_bypass_patterns = [
-            # Always true conditions
-            (r'if\s+True\s*:', "always_true_auth", 0.70),
-            # Debug mode bypasses
-            (r'if\s+debug\s*:', "debug_bypass", 0.60),
-            # Comment out auth
-            (r'#.*auth|//.*auth', "commented_auth", 0.50),
-            # Hardcoded admin checks
-            (r'user.*==.*["\']admin["\']', "hardcoded_admin", 0.75),
-        ]
         
         for line_num, line in enumerate(lines, 1):
             line_lower = line.lower()
@@ -447,8 +457,8 @@ class SecurityDetector(Detector):
             if not any(keyword in line_lower for keyword in ['auth', 'login', 'user', 'admin', 'permission']):
                 continue
             
-            for pattern, bypass_type, confidence in auth_bypass_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern, bypass_type, confidence in _AUTH_BYPASS_PATTERNS:
+                if pattern.search(line):
                     issues.append(DetectedIssue(
                         type=IssueType.MISSING_ERROR_HANDLING,  # Reusing enum
                         severity=Severity.HIGH,
@@ -460,7 +470,7 @@ class SecurityDetector(Detector):
                         fix_suggestion="Implement proper authentication checks",
                         confidence=confidence,
                         language=language,
-                        pattern_matched=pattern,
+                        pattern_matched=pattern.pattern,
                         matched_text=line.strip()[:100]
                     ))
         
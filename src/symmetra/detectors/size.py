@@ -15,7 +15,31 @@ Detection Categories:
 import re
 import ast
 from typing import List, Dict, Any, Optional, Tuple
-from .base import Detector, DetectedIssue, IssueType, Severity
+from .base import Detector, DetectedIssue, IssueType, Severity, parse_python
+
+
+# Comment-line patterns per language, each compiled into one alternation so a
+# line is classified with a single match instead of one match per pattern
+_C_STYLE_COMMENT = re.compile(r'\s*(?://|/\*|\*)')
+_COMMENT_PATTERNS = {
+    'python': re.compile(r'\s*#'),
+    'javascript': _C_STYLE_COMMENT,
+    'typescript': _C_STYLE_COMMENT,
+    'java': _C_STYLE_COMMENT,
+    'csharp': _C_STYLE_COMMENT,
+}
+_DEFAULT_COMMENT_PATTERN = re.compile(r'\s*(?:#|//|/\*|\*)')
+
+# Any JavaScript keyword that opens a nesting level
+_JS_NESTING_KEYWORD = re.compile(r'\b(?:if|for|while|switch|try|function)\b')
+
+# JavaScript function definitions, tried in order; group 1 is the function name
+_JS_FUNCTION_PATTERNS = [
+    re.compile(r'function\s+(\w+)\s*\('),
+    re.compile(r'const\s+(\w+)\s*=\s*\('),
+    re.compile(r'(\w+)\s*:\s*function\s*\('),
+    re.compile(r'(\w+)\s*=>\s*{'),
+]
 
 
 class SizeDetector(Detector):
@@ -59,11 +83,7 @@ class SizeDetector(Detector):
     def _check_file_size(self, code: str, file_path: str, language: str) -> List[DetectedIssue]:
         """Check if file is too large"""
         issues = []
-        lines = code.split('\n')
-        total_lines = len(lines)
-        
-        # Count non-empty, non-comment lines
-        significant_lines = self._count_significant_lines(lines, language)
+        total_lines = code.count('\n') + 1
         
         if total_lines > self.thresholds['max_file_lines']:
             severity = Severity.HIGH
@@ -74,6 +94,9 @@ class SizeDetector(Detector):
         else:
             return issues
         
+        # Count non-empty, non-comment lines (only needed for the report)
+        significant_lines = self._count_significant_lines(code.split('\n'), language)
+        
         # Calculate splitting suggestions
         split_suggestions = self._analyze_file_structure(code, language)
         
@@ -99,25 +122,12 @@ class SizeDetector(Detector):
     
     def _count_significant_lines(self, lines: List[str], language: str) -> int:
         """Count non-empty, non-comment lines"""
-        comment_patterns = {
-            'python': [r'^\s*#'],
-            'javascript': [r'^\s*//', r'^\s*/\*', r'^\s*\*'],
-            'typescript': [r'^\s*//', r'^\s*/\*', r'^\s*\*'],
-            'java': [r'^\s*//', r'^\s*/\*', r'^\s*\*'],
-            'csharp': [r'^\s*//', r'^\s*/\*', r'^\s*\*'],
-            'default': [r'^\s*#', r'^\s*//', r'^\s*/\*', r'^\s*\*']
-        }
-        
-        patterns = comment_patterns.get(language, comment_patterns['default'])
+        is_comment = _COMMENT_PATTERNS.get(language, _DEFAULT_COMMENT_PATTERN).match
         significant_count = 0
         
         for line in lines:
-            stripped = line.strip()
-            if not stripped:  # Empty line
-                continue
-            
-            is_comment = any(re.match(pattern, line) for pattern in patterns)
-            if not is_comment:
+            # Skip empty lines and comment lines
+            if line.strip() and not is_comment(line):
                 significant_count += 1
         
         return significant_count
@@ -140,7 +150,7 @@ class SizeDetector(Detector):
         suggestions = []
         
         try:
-            tree = ast.parse(code)
+            tree = parse_python(code)
             
             classes = []
             functions = []
@@ -174,7 +184,6 @@ class SizeDetector(Detector):
     def _analyze_javascript_structure(self, code: str) -> List[str]:
         """Analyze JavaScript/TypeScript structure"""
         suggestions = []
-        lines = code.split('\n')
         
         # Look for classes, functions, and exports
         classes = re.findall(r'class\s+(\w+)', code, re.IGNORECASE)
@@ -195,7 +204,6 @@ class SizeDetector(Detector):
     def _analyze_generic_structure(self, code: str) -> List[str]:
         """Generic structure analysis for unknown languages"""
         suggestions = []
-        lines = code.split('\n')
         
         # Look for common patterns
         class_like = len(re.findall(r'\b(class|struct|interface)\s+\w+', code, re.IGNORECASE))
@@ -224,7 +232,7 @@ class SizeDetector(Detector):
         issues = []
         
         try:
-            tree = ast.parse(code)
+            tree = parse_python(code)
             issues.extend(self._check_python_functions(tree, file_path))
             issues.extend(self._check_python_classes(tree, file_path))
             issues.extend(self._check_python_nesting(tree, file_path))
@@ -383,25 +391,16 @@ class SizeDetector(Detector):
         lines = code.split('\n')
         
         # Find functions and check their sizes
-        issues.extend(self._check_javascript_functions(code, file_path))
+        issues.extend(self._check_javascript_functions(lines, file_path))
         
         # Check for deep nesting
-        issues.extend(self._check_javascript_nesting(code, file_path))
+        issues.extend(self._check_javascript_nesting(lines, file_path))
         
         return issues
     
-    def _check_javascript_functions(self, code: str, file_path: str) -> List[DetectedIssue]:
+    def _check_javascript_functions(self, lines: List[str], file_path: str) -> List[DetectedIssue]:
         """Check JavaScript function sizes"""
         issues = []
-        lines = code.split('\n')
-        
-        # Find function definitions
-        function_patterns = [
-            r'function\s+(\w+)\s*\(',
-            r'const\s+(\w+)\s*=\s*\(',
-            r'(\w+)\s*:\s*function\s*\(',
-            r'(\w+)\s*=>\s*{',
-        ]
         
         current_function = None
         function_start = 0
@@ -410,8 +409,8 @@ class SizeDetector(Detector):
         for line_no, line in enumerate(lines, 1):
             # Look for function start
             if current_function is None:
-                for pattern in function_patterns:
-                    match = re.search(pattern, line)
+                for pattern in _JS_FUNCTION_PATTERNS:
+                    match = pattern.search(line)
                     if match:
                         current_function = match.group(1)
                         function_start = line_no
@@ -446,12 +445,10 @@ class SizeDetector(Detector):
         
         return issues
     
-    def _check_javascript_nesting(self, code: str, file_path: str) -> List[DetectedIssue]:
+    def _check_javascript_nesting(self, lines: List[str], file_path: str) -> List[DetectedIssue]:
         """Check for deep nesting in JavaScript"""
         issues = []
-        lines = code.split('\n')
         
-        nesting_keywords = ['if', 'for', 'while', 'switch', 'try', 'function']
         current_depth = 0
         max_depth = 0
         
@@ -460,11 +457,9 @@ class SizeDetector(Detector):
             open_braces = line.count('{')
             close_braces = line.count('}')
             
-            # Check for nesting keywords
-            for keyword in nesting_keywords:
-                if re.search(rf'\b{keyword}\b', line):
-                    current_depth += 1
-                    break
+            # A nesting keyword anywhere on the line opens one level
+            if _JS_NESTING_KEYWORD.search(line):
+                current_depth += 1
             
             current_depth += open_braces - close_braces
             
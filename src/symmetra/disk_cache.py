@@ -0,0 +1,73 @@
+"""
+Symmetra Disk Cache - Optional persistent cache for tool results
+
+Agents and CI runs restart the server often and then re-ask the same
+guidance and detection queries. When SYMMETRA_CACHE_DIR is set and the
+diskcache package is installed, those results are kept on disk for a day.
+Keys cover the tool, its inputs, the Symmetra version and the result format
+below, so results computed by code with a different output shape are never
+served.
+"""
+
+import logging
+import os
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Callable, Optional
+
+from . import __version__
+
+logger = logging.getLogger(__name__)
+
+# How long a persisted result stays valid
+_EXPIRE_SECONDS = 24 * 60 * 60
+
+# Bump whenever the output of a persisted tool changes, so older entries are ignored
+_RESULT_FORMAT = 2
+
+
+@lru_cache(maxsize=1)
+def get_disk_cache():
+    """Return the shared diskcache.Cache, or None when persistence is off"""
+    directory = os.getenv("SYMMETRA_CACHE_DIR")
+    if not directory:
+        return None
+    try:
+        import diskcache
+    except ImportError:
+        logger.warning("SYMMETRA_CACHE_DIR is set but diskcache is not installed; results are not persisted")
+        return None
+    return diskcache.Cache(os.path.expanduser(directory))
+
+
+def clear_disk_cache() -> None:
+    """Drop every persisted result (a no-op when persistence is off)"""
+    cache = get_disk_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def disk_cache_key(tool: str, code: str, *params: Any) -> str:
+    """Key for a tool result: the tool, Symmetra version, result format and parameters, then the code"""
+    digest = blake2b(repr((tool, __version__, _RESULT_FORMAT) + params).encode("utf-8", "surrogatepass"), digest_size=16)
+    digest.update(code.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def cached_call(tool: str, compute: Callable[[], Any], code: str, *params: Any,
+                cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+    """Return the persisted result for these inputs, computing and storing it on a miss
+
+    A computed result is only stored when cacheable (if given) accepts it.
+    """
+    cache = get_disk_cache()
+    if cache is None:
+        return compute()
+
+    key = disk_cache_key(tool, code, *params)
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        if cacheable is None or cacheable(result):
+            cache.set(key, result, expire=_EXPIRE_SECONDS)
+    return result
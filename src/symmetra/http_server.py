@@ -14,21 +14,35 @@ except ImportError:
     from symmetra.server import mcp
     from symmetra.config import SymmetraConfig
 
-# Create FastAPI app for uvicorn compatibility  
+# Create ASGI app for uvicorn compatibility (imported by each worker process)
 try:
-    app = mcp.create_app()
+    app = mcp.http_app(path=SymmetraConfig.get_http_path())
 except AttributeError:
-    import warnings
-    warnings.warn("MCP server does not support create_app method. HTTP mode may not work correctly.")
-    app = None
+    try:
+        app = mcp.create_app()
+    except AttributeError:
+        import warnings
+        warnings.warn("MCP server does not support create_app method. HTTP mode may not work correctly.")
+        app = None
 
-def main(host: str = None, port: int = None):
+def create_stateless_app():
+    """ASGI app factory for multi-worker mode (called by uvicorn in each worker process)
+    
+    Streamable-HTTP sessions live in the memory of the worker that opened
+    them, and a client's follow-up requests usually land on another worker.
+    Stateless mode answers every request on its own, so any worker can serve it.
+    """
+    return mcp.http_app(path=SymmetraConfig.get_http_path(), stateless_http=True)
+
+def main(host: str = None, port: int = None, workers: int = None):
     """Main entry point for the HTTP server"""
     # Use centralized config if not provided
     if host is None:
         host = SymmetraConfig.get_http_host()
     if port is None:
         port = SymmetraConfig.get_http_port()
+    if workers is None:
+        workers = SymmetraConfig.get_http_workers()
     
     path = SymmetraConfig.get_http_path()
     
@@ -36,6 +50,17 @@ def main(host: str = None, port: int = None):
     print(f"🌐 Server will be available at: http://localhost:{port}{path}")
     print("📋 Use this for production deployments and Docker containers")
     
+    if workers > 1 and app is not None:
+        # Serve concurrent agent sessions from a pool of worker processes, in
+        # stateless HTTP mode since MCP sessions are not shared between workers.
+        # uvicorn picks uvloop and httptools automatically when installed (uvicorn[standard])
+        import uvicorn
+        
+        print(f"👷 Workers: {workers} (stateless HTTP sessions)")
+        uvicorn.run("symmetra.http_server:create_stateless_app", factory=True,
+                    host=host, port=port, workers=workers)
+        return
+    
     # Run with HTTP transport for production
     mcp.run(transport="http", host=host, port=port, path=path)
 
@@ -0,0 +1,64 @@
+"""
+Symmetra Keyword Matcher - Single-pass multi-keyword category detection
+
+Guidance code classifies free text (actions, context, descriptions) by asking
+"does any of these keywords occur in the text?" for many keyword groups. Doing
+that with ``any(word in text for word in words)`` rescans the text once per
+keyword. KeywordMatcher compiles every keyword into one trie-shaped regular
+expression and walks the text once, reporting every category with a hit.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Mapping, Set
+
+
+class KeywordMatcher:
+    """Find which keyword categories occur in a text with a single scan.
+
+    ``matcher.match(text)`` returns the same categories as evaluating
+    ``any(word in text for word in words)`` for every category: plain substring
+    semantics, case-sensitive, overlapping occurrences included.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        owners: Dict[str, Set[str]] = {}
+        for category, words in categories.items():
+            for word in words:
+                owners.setdefault(word, set()).add(category)
+
+        # The scan reports the longest keyword starting at each position; every
+        # shorter keyword that is a prefix of it matched at the same position too
+        self._categories: Dict[str, FrozenSet[str]] = {
+            word: frozenset().union(*(owners[other] for other in owners if word.startswith(other)))
+            for word in owners
+        }
+
+        # Zero-width lookahead so overlapping keywords are all seen
+        self._pattern = re.compile(f"(?=({_trie_pattern(owners)}))")
+
+    def match(self, text: str) -> Set[str]:
+        """Return the set of categories with at least one keyword in text"""
+        hits: Set[str] = set()
+        for word in self._pattern.findall(text):
+            hits |= self._categories[word]
+        return hits
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation shaped like a prefix trie (longest match first)"""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ending here makes the longer continuations optional (greedy, so tried first)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
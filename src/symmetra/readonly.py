@@ -0,0 +1,29 @@
+"""
+Symmetra Read-Only Payloads - Constant tool results shared by every call
+
+Help text, category lists and similar tool results never change, so both
+MCP servers build them once and return the same object every time. Wrapping
+them in ReadOnlyDict makes an accidental in-place edit fail loudly instead
+of changing the answer for every later caller.
+"""
+
+
+class ReadOnlyDict(dict):
+    """dict that rejects mutation, so a shared constant payload can be returned by reference
+
+    A dict subclass (rather than types.MappingProxyType) so json, orjson and the
+    MCP tool serializers still encode it as a plain JSON object.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
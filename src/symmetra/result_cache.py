@@ -0,0 +1,76 @@
+"""
+Symmetra Result Cache - Bounded LRU of tool results keyed by an input digest
+
+Agents and IDE integrations often repeat the same tool call (autosave loops,
+retries). The tools are pure functions of their inputs, so a repeat can be
+answered from a small cache. Keys are BLAKE2b digests of the inputs rather
+than the inputs themselves, so large code snippets are not kept alive.
+"""
+
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, Optional
+
+
+def input_digest(code: str, *params: Any) -> bytes:
+    """Digest a code snippet together with the parameters it was analyzed with
+
+    Parameters are hashed through their repr, which keeps distinct tuples
+    distinct; the code is hashed last, as raw bytes, so it is never copied
+    into a larger string.
+    """
+    digest = blake2b(repr(params).encode("utf-8", "surrogatepass"), digest_size=16)
+    digest.update(code.encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def copy_result(value: Any) -> Any:
+    """Copy a cached JSON-shaped result so callers can modify it without touching the cache
+
+    Dicts and lists are copied at every level (tuples come back as lists);
+    strings, numbers and other leaves are immutable and shared.
+    """
+    if isinstance(value, dict):
+        return {key: copy_result(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [copy_result(item) for item in value]
+    return value
+
+
+class ResultCache:
+    """Thread-safe LRU map from input digests to results; oldest entries are evicted first"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached result for key (marking it recently used), or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Store a result, evicting the least recently used one when full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every cached result"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
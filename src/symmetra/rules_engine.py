@@ -7,18 +7,74 @@ both keyword-based matching (for immediate use) and vector-based semantic search
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 import json
+import logging
 import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# How long to skip the match_rules RPC after it fails before trying it again
+_RPC_RETRY_SECONDS = 60.0
+
+# Relevance multipliers applied by rule priority
+_PRIORITY_BOOST = {"high": 1.5, "medium": 1.2}
+
+
+def _freeze_rule(rule: Dict[str, Any]) -> Mapping[str, Any]:
+    """Make a bootstrap rule read-only so every engine can share one copy"""
+    frozen = dict(rule)
+    # Share one string object per token so membership checks hit identity fast paths
+    for field in ("keywords", "contexts", "tech_stacks"):
+        frozen[field] = tuple(sys.intern(token) for token in rule[field])
+    frozen["category"] = sys.intern(rule["category"])
+    frozen["priority"] = sys.intern(rule["priority"])
+    frozen["examples"] = tuple(rule["examples"])
+    return MappingProxyType(frozen)
+
+
+def _rules_digest(parts: Any) -> str:
+    """Stable digest of JSON-shaped rule data (the same in every process)"""
+    encoded = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return blake2b(encoded.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+def _read_package_data(name: str) -> str:
+    """Read a data file shipped inside the symmetra package"""
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python 3.8
+        from importlib.resources import read_text
+        return read_text(__package__, name, encoding="utf-8")
+    return files(__package__).joinpath(name).read_text(encoding="utf-8")
+
+
+# Initial set of Symmetra bootstrap rules, built once per process
+_BOOTSTRAP_RULES = tuple(
+    _freeze_rule(rule) for rule in json.loads(_read_package_data("bootstrap_rules.json"))
+)
 
 
 class RuleEngine(ABC):
     """Abstract base class for rule engines"""
     
+    # Bumped whenever this engine changes its rule set, so results derived
+    # from the rules can be cached until the next change
+    version: int = 0
+    
     @abstractmethod
     def find_relevant_rules(self, action: str, code: str = "", context: str = "", 
                           project_context: Optional[Dict] = None) -> List[Dict]:
-        """Find rules relevant to the given action and context"""
+        """Find rules relevant to the given action and context
+        
+        Rules served without a relevance search (stand-ins after a failed
+        search) carry "fallback": True, so callers do not cache results built on them.
+        """
         pass
     
     @abstractmethod
@@ -35,182 +91,115 @@ class RuleEngine(ABC):
     def list_all_rules(self) -> List[Dict]:
         """List all available rules"""
         pass
+    
+    def rules_fingerprint(self) -> Optional[str]:
+        """Digest identifying the rule set across processes and restarts
+        
+        Unlike version, equal fingerprints mean equal rule sets, so results
+        derived from the rules may be persisted under it. None when the
+        engine cannot tell which rules it is serving.
+        """
+        return None
 
 
 class KeywordRuleEngine(RuleEngine):
     """Keyword-based rule engine for immediate use"""
     
     def __init__(self):
+        self._fingerprint = None
         self.rules = self._load_bootstrap_rules()
     
+    @property
+    def rules(self) -> List[Dict]:
+        """Rules known to this engine"""
+        return self._rules
+    
+    @rules.setter
+    def rules(self, rules: List[Dict]) -> None:
+        self._rules = rules
+        self._scoring_table = None
+        self._search_table = None
+        self._fingerprint = None
+        self.version += 1
+    
+    def rules_fingerprint(self) -> Optional[str]:
+        """Digest of every rule's content, recomputed after the rules change"""
+        if self._fingerprint is None:
+            self._fingerprint = _rules_digest([dict(rule) for rule in self._rules])
+        return self._fingerprint
+    
     def _load_bootstrap_rules(self) -> List[Dict]:
         """Load initial set of Symmetra bootstrap rules"""
-        return [
-            # Vector Database Architecture Rules
-            {
-                "rule_id": "vector-db-choice",
-                "title": "Vector Database Selection",
-                "guidance": "🗄️ For vector storage, choose: ChromaDB (development/prototyping), Weaviate (production), or pgvector (PostgreSQL integration)",
-                "rationale": "Different vector databases excel in different contexts. ChromaDB is perfect for development, Weaviate scales well in production, and pgvector integrates seamlessly with existing PostgreSQL infrastructure.",
-                "keywords": ["vector", "database", "embedding", "storage", "chroma", "weaviate", "pgvector", "chromadb"],
-                "contexts": ["ide-assistant", "agent", "desktop-app"],
-                "tech_stacks": ["python", "ai", "ml", "database"],
-                "priority": "high",
-                "category": "architecture",
-                "examples": [
-                    "When building semantic search: Use ChromaDB for rapid prototyping",
-                    "For production AI systems: Consider Weaviate with proper clustering",
-                    "If using PostgreSQL: pgvector extension provides vector capabilities"
-                ]
-            },
-            {
-                "rule_id": "embedding-model-selection",
-                "title": "Text Embedding Model Choice", 
-                "guidance": "🧠 Use sentence-transformers for rule embeddings: all-MiniLM-L6-v2 (fast, 384d) or all-mpnet-base-v2 (quality, 768d)",
-                "rationale": "Sentence transformers provide high-quality semantic embeddings. MiniLM is faster and smaller, while mpnet provides better semantic understanding for complex texts.",
-                "keywords": ["embedding", "model", "sentence", "transformer", "semantic", "similarity", "minilm", "mpnet"],
-                "contexts": ["ide-assistant", "agent"],
-                "tech_stacks": ["python", "ai", "ml", "nlp"],
-                "priority": "medium",
-                "category": "ai-ml",
-                "examples": [
-                    "For real-time applications: all-MiniLM-L6-v2 provides good speed/quality tradeoff",
-                    "For high-accuracy semantic search: all-mpnet-base-v2 offers superior understanding",
-                    "Consider model size vs. inference speed based on deployment constraints"
-                ]
-            },
-            {
-                "rule_id": "sqlite-vector-hybrid",
-                "title": "Hybrid SQLite + Vector Storage",
-                "guidance": "💾 Store rule metadata in SQLite, vectors in dedicated vector DB. Link via rule_id for best performance and flexibility",
-                "rationale": "Hybrid storage leverages SQLite's ACID properties for metadata while using specialized vector databases for semantic search. This provides both relational integrity and vector performance.",
-                "keywords": ["sqlite", "database", "metadata", "hybrid", "storage", "relational", "vector", "architecture"],
-                "contexts": ["ide-assistant", "agent"],
-                "tech_stacks": ["python", "sqlite", "database"],
-                "priority": "medium",
-                "category": "architecture",
-                "examples": [
-                    "Store rule text, timestamps, categories in SQLite",
-                    "Store embeddings in ChromaDB/Weaviate with rule_id as foreign key",
-                    "Use SQLite for complex queries, vector DB for similarity search"
-                ]
-            },
-            {
-                "rule_id": "mcp-tool-design",
-                "title": "MCP Tool Performance Design",
-                "guidance": "🔧 MCP tools should be stateless, fast (<100ms response), and return structured data optimized for AI consumption",
-                "rationale": "MCP tools are called frequently during AI workflows. Fast, stateless tools provide better user experience and enable real-time guidance without breaking flow.",
-                "keywords": ["mcp", "tool", "design", "performance", "stateless", "fast", "structured", "api"],
-                "contexts": ["ide-assistant", "agent"],
-                "tech_stacks": ["python", "mcp", "api"],
-                "priority": "high",
-                "category": "performance",
-                "examples": [
-                    "Avoid database calls in tool functions - cache data at startup",
-                    "Return JSON with consistent structure for AI parsing",
-                    "Use async patterns for I/O operations"
-                ]
-            },
-            {
-                "rule_id": "symmetra-project-structure",
-                "title": "Symmetra Project Organization",
-                "guidance": "📁 Organize Symmetra modules: rules_engine (core logic), server (MCP interface), cli (user interface), config (settings)",
-                "rationale": "Clear separation of concerns makes Symmetra easier to extend and maintain. Each module has a single responsibility.",
-                "keywords": ["project", "structure", "organization", "modules", "separation", "concerns", "symmetra"],
-                "contexts": ["ide-assistant"],
-                "tech_stacks": ["python", "project-structure"],
-                "priority": "medium",
-                "category": "architecture",
-                "examples": [
-                    "rules_engine/: Core rule matching and retrieval logic",
-                    "server/: MCP protocol implementation",
-                    "cli/: Command-line interface and user interactions",
-                    "config/: Configuration management and rule loading"
-                ]
-            },
-            {
-                "rule_id": "config-layered-approach",
-                "title": "Layered Configuration System",
-                "guidance": "⚙️ Use layered config: global defaults → project .symmetra.toml → runtime parameters. Higher layers override lower ones",
-                "rationale": "Layered configuration provides flexibility while maintaining sensible defaults. Users can customize at the appropriate level without breaking the system.",
-                "keywords": ["config", "configuration", "layered", "toml", "defaults", "override", "settings"],
-                "contexts": ["ide-assistant", "agent"],
-                "tech_stacks": ["python", "toml", "config"],
-                "priority": "medium",
-                "category": "architecture",
-                "examples": [
-                    "Global: ~/.config/symmetra/config.toml",
-                    "Project: .symmetra.toml in project root", 
-                    "Runtime: --context, --project CLI parameters"
-                ]
-            },
-            {
-                "rule_id": "testing-multiple-transports",
-                "title": "Multi-Transport Testing Strategy",
-                "guidance": "🧪 Test Symmetra across all transports: in-memory (fast iteration), stdio (Claude Code), HTTP (production)",
-                "rationale": "Different transports have different failure modes. Comprehensive testing ensures reliable operation across all deployment scenarios.",
-                "keywords": ["testing", "transport", "stdio", "http", "memory", "mcp", "integration"],
-                "contexts": ["ide-assistant"],
-                "tech_stacks": ["python", "testing", "mcp"],
-                "priority": "high",
-                "category": "testing",
-                "examples": [
-                    "In-memory: Direct function calls for unit testing",
-                    "Stdio: Subprocess testing for Claude Code integration",
-                    "HTTP: Server testing for production deployment"
-                ]
-            },
-            {
-                "rule_id": "context-aware-guidance",
-                "title": "Context-Aware Rule Application",
-                "guidance": "🎯 Apply different rules based on context: ide-assistant (code completion), agent (automation), desktop-app (conversation)",
-                "rationale": "Different contexts have different needs. IDE integration needs precise, actionable advice, while conversational contexts can be more explanatory.",
-                "keywords": ["context", "aware", "ide", "assistant", "agent", "desktop", "guidance", "adaptive"],
-                "contexts": ["ide-assistant", "agent", "desktop-app"],
-                "tech_stacks": ["python", "mcp"],
-                "priority": "medium",
-                "category": "ux",
-                "examples": [
-                    "IDE: Terse, actionable suggestions for quick implementation",
-                    "Agent: Structured data for programmatic processing",
-                    "Desktop: Explanatory guidance with educational context"
-                ]
-            }
-        ]
+        # Shared read-only rules; add_rule only ever appends to this per-engine list
+        return list(_BOOTSTRAP_RULES)
+    
+    def _get_scoring_table(self) -> tuple:
+        """Per-rule scoring constants, precomputed so the scoring loop does no dict lookups"""
+        if self._scoring_table is None:
+            self._scoring_table = tuple(
+                (
+                    rule,
+                    tuple(rule["keywords"]),
+                    frozenset(rule.get("contexts", ())),
+                    len(rule["keywords"]),
+                    _PRIORITY_BOOST.get(rule.get("priority"), 1.0),
+                )
+                for rule in self._rules
+            )
+        return self._scoring_table
+    
+    def _get_search_table(self) -> tuple:
+        """Lowercased searchable fields per rule, and a corpus index over all of them
+        
+        Returns (rows, corpus, starts): rows holds each rule with its lowercased
+        fields, corpus joins every rule's fields into one string, and starts[i]
+        is the offset where rule i begins in the corpus.
+        """
+        if self._search_table is None:
+            rows = []
+            blobs = []
+            starts = []
+            offset = 0
+            for rule in self._rules:
+                title = rule.get("title", "").lower()
+                guidance = rule.get("guidance", "").lower()
+                rationale = rule.get("rationale", "").lower()
+                keywords = tuple(keyword.lower() for keyword in rule.get("keywords", []))
+                # NUL separators keep a query from matching across field boundaries
+                blob = "\0".join((title, guidance, rationale) + keywords)
+                rows.append((rule, title, guidance, rationale, keywords))
+                blobs.append(blob)
+                starts.append(offset)
+                offset += len(blob) + 1
+            self._search_table = (tuple(rows), "\0".join(blobs), tuple(starts))
+        return self._search_table
     
     def find_relevant_rules(self, action: str, code: str = "", context: str = "", 
                           project_context: Optional[Dict] = None) -> List[Dict]:
         """Find rules using keyword matching and context filtering"""
-        action_lower = action.lower()
-        code_lower = code.lower() if code else ""
-        search_text = f"{action_lower} {code_lower}"
+        # One lowercase pass over the joined text; lowering action and code
+        # separately and then joining them copies the code twice
+        search_text = f"{action} {code}".lower()
+        server_context = project_context.get("server_context", "") if project_context else None
         
         relevant_rules = []
         
-        for rule in self.rules:
+        for rule, keywords, contexts, keyword_count, priority_boost in self._get_scoring_table():
             # Check if context matches (if specified)
-            if context and context not in rule.get("contexts", []):
+            if context and context not in contexts:
                 continue
             
             # Calculate keyword relevance score
-            keyword_matches = sum(1 for keyword in rule["keywords"] if keyword in search_text)
+            keyword_matches = sum(1 for keyword in keywords if keyword in search_text)
             if keyword_matches == 0:
                 continue
             
-            # Calculate relevance score
-            relevance_score = keyword_matches / len(rule["keywords"])
-            
-            # Boost score for high priority rules
-            if rule.get("priority") == "high":
-                relevance_score *= 1.5
-            elif rule.get("priority") == "medium":
-                relevance_score *= 1.2
+            # Calculate relevance score, boosted for high priority rules
+            relevance_score = keyword_matches / keyword_count * priority_boost
             
             # Add project context relevance if available
-            if project_context:
-                server_context = project_context.get("server_context", "")
-                if server_context in rule.get("contexts", []):
-                    relevance_score *= 1.3
+            if server_context is not None and server_context in contexts:
+                relevance_score *= 1.3
             
             rule_copy = rule.copy()
             rule_copy["relevance_score"] = relevance_score
@@ -232,7 +221,11 @@ class KeywordRuleEngine(RuleEngine):
             if any(existing["rule_id"] == rule["rule_id"] for existing in self.rules):
                 return False
             
-            self.rules.append(rule)
+            self._rules.append(rule)
+            self._scoring_table = None
+            self._search_table = None
+            self._fingerprint = None
+            self.version += 1
             return True
         except Exception:
             return False
@@ -256,25 +249,36 @@ class KeywordRuleEngine(RuleEngine):
         """Search rules by query text across all fields"""
         query_lower = query.lower()
         scored_rules = []
+        rows, corpus, starts = self._get_search_table()
         
-        for rule in self.rules:
+        # Walk the corpus with str.find, jumping to the next rule after each hit,
+        # so only rules containing the query somewhere are scored field by field
+        candidates = []
+        position = corpus.find(query_lower)
+        while position != -1 and starts:
+            index = bisect_right(starts, position) - 1
+            candidates.append(index)
+            if index + 1 == len(starts):
+                break
+            position = corpus.find(query_lower, starts[index + 1])
+        
+        for index in candidates:
+            rule, title, guidance, rationale, keywords = rows[index]
             score = 0
             
             # Search in title
-            if query_lower in rule.get("title", "").lower():
+            if query_lower in title:
                 score += 3
             
             # Search in guidance
-            if query_lower in rule.get("guidance", "").lower():
+            if query_lower in guidance:
                 score += 2
             
             # Search in keywords
-            matching_keywords = sum(1 for keyword in rule.get("keywords", []) 
-                                  if query_lower in keyword.lower())
-            score += matching_keywords
+            score += sum(1 for keyword in keywords if query_lower in keyword)
             
             # Search in rationale
-            if query_lower in rule.get("rationale", "").lower():
+            if query_lower in rationale:
                 score += 1
             
             if score > 0:
@@ -291,7 +295,7 @@ class VectorRuleEngine(RuleEngine):
     """Vector-based rule engine for semantic search using Supabase + pgvector"""
     
     def __init__(self, supabase_url: str = None, supabase_key: str = None, 
-                 embedding_model: str = "all-MiniLM-L6-v2"):
+                 embedding_model: str = "all-MiniLM-L6-v2", use_local_index: bool = True):
         # Load from environment variables if not provided
         self.supabase_url = supabase_url or os.getenv("SYMMETRA_SUPABASE_URL")
         self.supabase_key = supabase_key or os.getenv("SYMMETRA_SUPABASE_KEY")
@@ -316,6 +320,91 @@ class VectorRuleEngine(RuleEngine):
             self.encoder = SentenceTransformer(embedding_model)
         except ImportError:
             raise ImportError("sentence-transformers package required for vector search. Install with: pip install sentence-transformers")
+        
+        # In-process copy of all rule embeddings (built once at startup)
+        self._emb = None
+        self._index = None
+        self._index_rules: List[Dict] = []
+        self._fingerprint: Optional[str] = None
+        if use_local_index:
+            self._build_local_index()
+        
+        # Circuit breaker for the match_rules RPC and its cached fallback rows
+        self._rpc_retry_at = 0.0
+        self._fallback_rules: Optional[List[Dict]] = None
+    
+    def _build_local_index(self) -> None:
+        """Load every rule embedding once and search them in-process.
+        
+        Rule sets are small (hundreds to thousands of rows), so searching them
+        locally is sub-millisecond and removes the per-query match_rules RPC.
+        Rows are L2-normalized at ingest so cosine similarity is a single
+        matrix-vector product; an int8-quantized FAISS HNSW index is layered
+        on top when faiss is installed.
+        """
+        import numpy as np
+        
+        try:
+            response = self.supabase.table('rules').select('*').execute()
+        except Exception:
+            logger.warning("Loading rule embeddings failed, using match_rules RPC", exc_info=True)
+            return
+        
+        rows = [rule for rule in (response.data or []) if rule.get('embedding')]
+        if not rows:
+            return
+        
+        embeddings = np.asarray([_parse_embedding(rule['embedding']) for rule in rows], dtype=np.float32)
+        self._emb = np.ascontiguousarray(_normalize_rows(embeddings))
+        # Rows are edited in place (updated_at trigger), so id + timestamp identify the set
+        self._fingerprint = _rules_digest(sorted(
+            (str(rule.get('rule_id')), str(rule.get('updated_at'))) for rule in rows
+        ))
+        # Result-shaped rule metadata, stored in index order next to the vectors
+        self._index_rules = self._format_rules(rows)
+        
+        try:
+            import faiss
+        except ImportError:
+            return
+        
+        # Inner product over L2-normalized vectors is cosine similarity. Vectors are
+        # stored as 8-bit scalar-quantized codes (384 B per MiniLM rule instead of 1.5 KB)
+        self._index = faiss.IndexHNSWSQ(
+            self._emb.shape[1], faiss.ScalarQuantizer.QT_8bit, 32, faiss.METRIC_INNER_PRODUCT
+        )
+        self._index.train(self._emb)
+        self._index.add(self._emb)
+    
+    def rules_fingerprint(self) -> Optional[str]:
+        """Digest of the rules in the local index (None when queries go to the match_rules RPC)"""
+        return self._fingerprint
+    
+    def _search_local_index(self, query_embedding, match_threshold: float, match_count: int) -> List[Dict]:
+        """Search the in-process embeddings, returning formatted rules scored by similarity"""
+        import numpy as np
+        
+        query = _normalize_rows(np.asarray(query_embedding, dtype=np.float32).reshape(1, -1))
+        match_count = min(match_count, len(self._index_rules))
+        
+        if self._index is not None:
+            scores, ids = self._index.search(query, match_count)
+            scores, ids = scores[0], ids[0]
+        else:
+            # One BLAS GEMV, then an O(N) partial selection of the top matches
+            all_scores = self._emb @ query[0]
+            ids = np.argpartition(-all_scores, match_count - 1)[:match_count]
+            ids = ids[np.argsort(-all_scores[ids])]
+            scores = all_scores[ids]
+        
+        rules = []
+        for score, rule_idx in zip(scores, ids):
+            if rule_idx < 0 or score < match_threshold:
+                continue
+            rule = dict(self._index_rules[rule_idx])
+            rule['search_score'] = float(score)
+            rules.append(rule)
+        return rules
     
     def find_relevant_rules(self, action: str, code: str = "", context: str = "", 
                           project_context: Optional[Dict] = None) -> List[Dict]:
@@ -330,30 +419,44 @@ class VectorRuleEngine(RuleEngine):
         query_text = " ".join(query_parts)
         
         # Generate embedding for the query
-        query_embedding = self.encoder.encode(query_text).tolist()
+        query_embedding = self.encoder.encode(query_text)
         
-        # Perform vector similarity search
-        try:
-            # Use Supabase's vector similarity search
-            # The embedding column should be compared using cosine similarity
-            response = self.supabase.rpc(
-                'match_rules',
-                {
-                    'query_embedding': query_embedding,
-                    'match_threshold': 0.7,
-                    'match_count': 10
-                }
-            ).execute()
-            
-            rules = response.data if response.data else []
-            
-        except Exception as e:
-            # Fallback to basic SQL query if RPC function doesn't exist
-            print(f"Vector search RPC failed, falling back to basic query: {e}")
+        if self._emb is not None:
+            return self._search_local_index(query_embedding, match_threshold=0.7, match_count=10)
+        
+        # Perform vector similarity search unless the RPC recently failed
+        if time.monotonic() >= self._rpc_retry_at:
+            try:
+                # Use Supabase's vector similarity search
+                # The embedding column should be compared using cosine similarity
+                response = self.supabase.rpc(
+                    'match_rules',
+                    {
+                        'query_embedding': query_embedding.tolist(),
+                        'match_threshold': 0.7,
+                        'match_count': 10
+                    }
+                ).execute()
+                
+                return self._format_rules(response.data if response.data else [])
+                
+            except Exception:
+                logger.warning("Vector search RPC failed, falling back to basic query", exc_info=True)
+                self._rpc_retry_at = time.monotonic() + _RPC_RETRY_SECONDS
+        
+        # Fallback to basic SQL query if RPC function doesn't exist; fetched once
+        # per rule set version (add_rules drops the cached rows)
+        if self._fallback_rules is None:
             response = self.supabase.table('rules').select('*').limit(10).execute()
-            rules = response.data if response.data else []
+            self._fallback_rules = response.data if response.data else []
         
-        # Convert to expected format
+        rules = self._format_rules(self._fallback_rules)
+        for rule in rules:
+            rule["fallback"] = True
+        return rules
+    
+    def _format_rules(self, rules: List[Dict]) -> List[Dict]:
+        """Convert raw rule rows to the engine's result format"""
         result_rules = []
         for rule in rules:
             result_rules.append({
@@ -372,21 +475,75 @@ class VectorRuleEngine(RuleEngine):
     
     def add_rule(self, rule: Dict) -> bool:
         """Add a new rule and compute its embedding"""
+        return self.add_rules([rule]) == 1
+    
+    def add_rules(self, rules: List[Dict]) -> int:
+        """Add several rules with one batched encode and one transactional insert.
+        
+        Returns the number of rules inserted.
+        """
+        if not rules:
+            return 0
+        
         try:
-            # Generate embedding for title + guidance
-            text_to_embed = f"{rule.get('title', '')} {rule.get('guidance', '')}"
-            embedding = self.encoder.encode(text_to_embed).tolist()
+            # Generate embeddings for title + guidance in a single batch
+            texts = [f"{rule.get('title', '')} {rule.get('guidance', '')}" for rule in rules]
+            embeddings = self._encode_corpus(texts)
             
-            # Add embedding to rule data
-            rule_data = rule.copy()
-            rule_data['embedding'] = embedding
+            rows = []
+            for rule, embedding in zip(rules, embeddings):
+                rule_data = rule.copy()
+                rule_data['embedding'] = embedding.tolist()
+                rows.append(rule_data)
             
-            # Insert into Supabase
-            response = self.supabase.table('rules').insert(rule_data).execute()
-            return bool(response.data)
-        except Exception as e:
-            print(f"Error adding rule: {e}")
-            return False
+            # insert_rules_tx (sql/migrations/009) inserts all rows in one transaction
+            response = self.supabase.rpc('insert_rules_tx', {'rows': rows}).execute()
+            inserted = response.data or 0
+            if inserted:
+                self.version += 1
+                # Re-fetch the fallback rows so they include the new rules
+                self._fallback_rules = None
+                # The new rows' timestamps are not known here; stop persisting until restart
+                self._fingerprint = None
+                if self._emb is not None:
+                    self._add_to_local_index(rules, embeddings)
+            return inserted
+        except Exception:
+            logger.exception("Error adding rules")
+            return 0
+    
+    def _encode_corpus(self, texts: List[str], bucket_size: int = 32):
+        """Encode many texts in buckets of similar token length.
+        
+        Sorting by token count keeps each batch close in length, so short rules
+        are not padded up to the longest rule in the corpus. Embeddings are
+        returned in the original order.
+        """
+        import numpy as np
+        
+        token_ids = self.encoder.tokenizer(texts, add_special_tokens=False)["input_ids"]
+        order = np.argsort([len(ids) for ids in token_ids], kind="stable")
+        
+        buckets = [
+            self.encoder.encode([texts[i] for i in order[start:start + bucket_size]],
+                                batch_size=bucket_size, convert_to_numpy=True)
+            for start in range(0, len(texts), bucket_size)
+        ]
+        
+        sorted_embeddings = np.concatenate(buckets)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+    
+    def _add_to_local_index(self, rules: List[Dict], embeddings) -> None:
+        """Keep the in-process embeddings in sync with newly inserted rules"""
+        import numpy as np
+        
+        vectors = _normalize_rows(np.array(embeddings, dtype=np.float32).reshape(len(rules), -1))
+        self._emb = np.ascontiguousarray(np.vstack([self._emb, vectors]))
+        if self._index is not None:
+            self._index.add(vectors)
+        self._index_rules.extend(self._format_rules(rules))
     
     def get_rule_by_id(self, rule_id: str) -> Optional[Dict]:
         """Get a specific rule by ID"""
@@ -405,8 +562,8 @@ class VectorRuleEngine(RuleEngine):
                     "keywords": rule.get("keywords", [])
                 }
             return None
-        except Exception as e:
-            print(f"Error getting rule: {e}")
+        except Exception:
+            logger.exception("Error getting rule %s", rule_id)
             return None
     
     def list_all_rules(self) -> List[Dict]:
@@ -429,8 +586,8 @@ class VectorRuleEngine(RuleEngine):
                 })
             
             return result_rules
-        except Exception as e:
-            print(f"Error listing rules: {e}")
+        except Exception:
+            logger.exception("Error listing rules")
             return []
     
     def search_rules(self, query: str, max_results: int = 5) -> List[Dict]:
@@ -438,6 +595,22 @@ class VectorRuleEngine(RuleEngine):
         return self.find_relevant_rules(action=query)[:max_results]
 
 
+def _parse_embedding(value: Any) -> List[float]:
+    """Decode a pgvector column, which PostgREST returns as a '[...]' string"""
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def _normalize_rows(matrix):
+    """L2-normalize each row of a float32 matrix"""
+    import numpy as np
+    
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
 # Factory function for easy engine creation
 def create_rule_engine(engine_type: str = None, **kwargs) -> RuleEngine:
     """Create a rule engine of the specified type"""
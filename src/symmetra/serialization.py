@@ -0,0 +1,22 @@
+"""
+Symmetra Serialization - Fast JSON encoding of MCP tool results
+
+Tool results (issue lists, guidance lists, context lines) are serialized on
+every call. Both MCP servers hand fastmcp an orjson-based serializer when
+orjson is installed; it is several times faster than the stdlib json module
+fastmcp falls back to.
+"""
+
+
+def get_tool_serializer():
+    """Return an orjson-based tool result serializer, or None for fastmcp's default"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    def serialize(data) -> str:
+        # default=str mirrors fastmcp's fallback for values JSON can't represent
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    return serialize
@@ -3,24 +3,41 @@ Symmetra v0 - AI Governance MCP Server (Refactored)
 Provides real-time coding guidance for AI agents.
 
 This is the clean, refactored version with proper separation of concerns.
+
+FastMCP (and its pydantic/starlette stack) is only imported when the server
+object is first needed, and the detection engine and analyzers only on the
+first detection tool call, so importing this module and starting up stay cheap.
 """
 
-from fastmcp import FastMCP
+import functools
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .serialization import get_tool_serializer
 from .tools import (
-    get_guidance, search_rules, list_rule_categories,
-    detect_issues, analyze_code_context, batch_analyze_issues, get_detection_info,
+    get_guidance, search_rules, list_rule_categories, reset_caches,
     get_symmetra_help, get_rules_resource, get_review_code_prompt
 )
 
-# Create the Symmetra MCP server
-mcp = FastMCP("Symmetra")
+# The Symmetra MCP server, created on first access of ``mcp``
+_mcp = None
+
+
+class ServerContext(NamedTuple):
+    """Server context and project, fixed when a server is created"""
+    context: str = "desktop-app"
+    project: Optional[str] = None
+
 
-# Global variables to store server context and project
-_server_context = "desktop-app"
-_server_project = None
+_DEFAULT_SERVER = ServerContext()
 
-@mcp.tool
-def get_guidance_tool(action: str, code: str = "", context: str = "") -> dict:
+# Tools that take a keyword-only ``server`` argument get it bound per server by
+# create_server(), so it never shows up in the MCP tool schema
+def _takes_server(tool) -> bool:
+    """Whether a tool function accepts the per-server ``server`` argument"""
+    return "server" in (tool.__kwdefaults__ or {})
+
+def get_guidance_tool(action: str, code: str = "", context: str = "", *,
+                      server: ServerContext = _DEFAULT_SERVER) -> dict:
     """
     🏗️ Get comprehensive architectural guidance for coding actions
     
@@ -58,9 +75,8 @@ def get_guidance_tool(action: str, code: str = "", context: str = "") -> dict:
         "Review this 200-line component for architectural improvements"
         "Suggest database schema design for e-commerce orders"
     """
-    return get_guidance(action, code, context, _server_context, _server_project)
+    return get_guidance(action, code, context, server_context=server.context, server_project=server.project)
 
-@mcp.tool  
 def search_rules_tool(query: str, max_results: int = 5) -> dict:
     """
     🔍 Search Symmetra rules by query text
@@ -77,7 +93,6 @@ def search_rules_tool(query: str, max_results: int = 5) -> dict:
     """
     return search_rules(query, max_results)
 
-@mcp.tool
 def list_rule_categories_tool() -> dict:
     """
     📋 List all available rule categories
@@ -87,9 +102,10 @@ def list_rule_categories_tool() -> dict:
     """
     return list_rule_categories()
 
-@mcp.tool
-def detect_issues_tool(code: str, file_path: str = "unknown.py", language: str = None, 
-                      report_type: str = "summary", project_context: dict = None) -> dict:
+def detect_issues_tool(code: str = "", file_path: str = "unknown.py", language: str = None, 
+                      report_type: str = "summary", project_context: dict = None,
+                      code_path: str = None, *,
+                      server: ServerContext = _DEFAULT_SERVER) -> dict:
     """
     🔍 Detect specific code issues using hybrid analysis
     
@@ -108,6 +124,9 @@ def detect_issues_tool(code: str, file_path: str = "unknown.py", language: str =
         language: Programming language (auto-detected if not provided)
         report_type: Format of results ("summary", "ide_assistant", "agent", "desktop_app", "security_audit")
         project_context: Additional project context (environment, framework, etc.)
+        code_path: Path of a file in the server's project directory to analyze instead of
+                   sending its contents as code (saves shipping large files through the
+                   request; needs a server started with --project)
         
     Returns:
         Comprehensive detection results with:
@@ -121,10 +140,10 @@ def detect_issues_tool(code: str, file_path: str = "unknown.py", language: str =
         "Analyze this 500-line file for maintainability issues"
         "Scan this API endpoint for common code problems"
     """
+    from .tools.detection_tools import detect_issues
     return detect_issues(code, file_path, language, report_type, project_context, 
-                        _server_context, _server_project)
+                        server.context, server.project, code_path=code_path)
 
-@mcp.tool
 def analyze_code_context_tool(code: str, line_number: int = None, language: str = None, 
                              focus_keywords: list = None) -> dict:
     """
@@ -147,11 +166,13 @@ def analyze_code_context_tool(code: str, line_number: int = None, language: str
         - formatted_context: Human-readable context display
         - summary: Natural language description of the context
     """
+    from .tools.detection_tools import analyze_code_context
     return analyze_code_context(code, line_number, language, focus_keywords)
 
-@mcp.tool
-def batch_analyze_issues_tool(code: str, file_path: str = "unknown.py", 
-                             enable_llm_analysis: bool = False, project_context: dict = None) -> dict:
+async def batch_analyze_issues_tool(code: str, file_path: str = "unknown.py", 
+                                   enable_llm_analysis: bool = False, project_context: dict = None,
+                                   report_types: list = None, *,
+                                   server: ServerContext = _DEFAULT_SERVER) -> dict:
     """
     🧠 Perform comprehensive batch analysis with optional LLM enhancement
     
@@ -164,6 +185,8 @@ def batch_analyze_issues_tool(code: str, file_path: str = "unknown.py",
         file_path: Path to the file being analyzed
         enable_llm_analysis: Whether to include LLM-powered contextual analysis
         project_context: Additional project context and constraints
+        report_types: Report formats to include (default: summary, ide_assistant,
+                      agent and desktop_app); request only the ones you will read
         
     Returns:
         Comprehensive analysis with:
@@ -173,10 +196,17 @@ def batch_analyze_issues_tool(code: str, file_path: str = "unknown.py",
         - patterns: Identified code patterns and issues
         - report_options: Different report formats available
     """
-    return batch_analyze_issues(code, file_path, enable_llm_analysis, project_context,
-                               _server_context, _server_project)
+    import asyncio
+    from .tools.detection_tools import batch_analyze_issues
+    
+    # The heaviest tool (detection, LLM analysis and several reports); run it in
+    # a worker thread so the server keeps answering other requests meanwhile
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(
+        batch_analyze_issues, code, file_path, enable_llm_analysis, project_context,
+        server.context, server.project, report_types
+    ))
 
-@mcp.tool
 def get_detection_info_tool() -> dict:
     """
     ℹ️ Get information about Symmetra's detection capabilities
@@ -192,9 +222,9 @@ def get_detection_info_tool() -> dict:
         - detection_patterns: Types of patterns and issues detected
         - statistics: Performance and capability metrics
     """
+    from .tools.detection_tools import get_detection_info
     return get_detection_info()
 
-@mcp.tool
 def get_symmetra_help_tool() -> dict:
     """
     📚 Get comprehensive help on using Symmetra effectively
@@ -211,7 +241,98 @@ def get_symmetra_help_tool() -> dict:
     """
     return get_symmetra_help()
 
-@mcp.resource("symmetra://rules")
+def reset_caches_tool() -> dict:
+    """
+    🧹 Clear Symmetra's cached guidance, search and category results
+    
+    Repeated guidance, rule search and category queries are answered from
+    bounded in-memory caches, and from the disk cache when SYMMETRA_CACHE_DIR
+    is set. Rules added through Symmetra refresh them automatically; call this
+    after rules were changed directly in the rule store so the next queries
+    see the current rule set.
+    
+    Returns:
+        Confirmation that the caches were cleared
+    """
+    reset_caches()
+    return {"status": "cleared"}
+
+async def batch_execute_tool(calls: List[Dict[str, Any]], *,
+                             server: ServerContext = _DEFAULT_SERVER) -> dict:
+    """
+    📦 Run several Symmetra tools in one request
+    
+    Use this when you need more than one Symmetra tool at once (for example
+    guidance for an action plus issue detection on the related code). All
+    calls run concurrently and the results come back in the order given,
+    saving one round trip per extra call.
+    
+    Args:
+        calls: Up to 64 {"tool": name, "args": {...}} entries. Tool names are
+               the tool names without the "_tool" suffix: get_guidance,
+               search_rules, list_rule_categories, detect_issues,
+               analyze_code_context, batch_analyze_issues,
+               get_detection_info, get_symmetra_help
+        
+    Returns:
+        Dictionary with:
+        - results: One {"tool", "ok", "result" or "error"} entry per call, in input order
+        - succeeded: Number of calls that completed
+        - failed: Number of calls that raised an error
+    """
+    import asyncio
+    
+    if len(calls) > _MAX_BATCH_CALLS:
+        raise ValueError(f"A batch may hold at most {_MAX_BATCH_CALLS} calls, got {len(calls)}")
+    
+    loop = asyncio.get_running_loop()
+    
+    async def run(call: Dict[str, Any]) -> Dict[str, Any]:
+        # A malformed entry fails on its own instead of failing the whole batch
+        name = call.get("tool") if isinstance(call, dict) else None
+        try:
+            if not isinstance(call, dict):
+                raise ValueError("Each call must be an object with a 'tool' name")
+            if not isinstance(name, str) or name not in _BATCH_TOOLS:
+                raise ValueError(f"Unknown tool: {name}")
+            tool, takes_server = _BATCH_TOOLS[name]
+            args = call.get("args") or {}
+            if not isinstance(args, dict):
+                raise ValueError("'args' must be an object of keyword arguments")
+            args = dict(args)
+            if takes_server:
+                args["server"] = server
+            if asyncio.iscoroutinefunction(tool):
+                result = await tool(**args)
+            else:
+                # Analyzers are CPU-bound and synchronous; keep them off the event loop
+                result = await loop.run_in_executor(None, functools.partial(tool, **args))
+        except Exception as e:
+            return {"tool": name, "ok": False, "error": str(e)}
+        return {"tool": name, "ok": True, "result": result}
+    
+    results = await asyncio.gather(*(run(call) for call in calls))
+    succeeded = sum(1 for result in results if result["ok"])
+    return {"results": results, "succeeded": succeeded, "failed": len(results) - succeeded}
+
+# Most calls one batch_execute_tool request may hold
+_MAX_BATCH_CALLS = 64
+
+# Tools reachable through batch_execute_tool, by name, with whether each takes ``server``
+_BATCH_TOOLS = {
+    name: (tool, _takes_server(tool))
+    for name, tool in (
+        ("get_guidance", get_guidance_tool),
+        ("search_rules", search_rules_tool),
+        ("list_rule_categories", list_rule_categories_tool),
+        ("detect_issues", detect_issues_tool),
+        ("analyze_code_context", analyze_code_context_tool),
+        ("batch_analyze_issues", batch_analyze_issues_tool),
+        ("get_detection_info", get_detection_info_tool),
+        ("get_symmetra_help", get_symmetra_help_tool),
+    )
+}
+
 def get_rules() -> str:
     """
     📋 Access Symmetra's comprehensive architectural governance rules
@@ -226,7 +347,6 @@ def get_rules() -> str:
     """
     return get_rules_resource()
 
-@mcp.prompt  
 def review_code(code: str) -> str:
     """
     🔍 Generate comprehensive architectural code review prompt
@@ -250,21 +370,85 @@ def review_code(code: str) -> str:
     """
     return get_review_code_prompt(code)
 
+def test_guidance_with_context(action: str, code: str = "", context: str = "",
+                               server_context: Optional[str] = None) -> dict:
+    """Get guidance as if the server ran in server_context (test helper)
+    
+    The context is passed straight through rather than swapped into any
+    shared state, so concurrent tool calls are unaffected.
+    """
+    return get_guidance(action, code, context,
+                        server_context=server_context or _DEFAULT_SERVER.context,
+                        server_project=_DEFAULT_SERVER.project)
+
+def _bind_server(tool, server: ServerContext):
+    """Return tool with its ``server`` argument fixed, hidden from the signature"""
+    import inspect
+    
+    signature = inspect.signature(tool)
+    
+    if inspect.iscoroutinefunction(tool):
+        @functools.wraps(tool)
+        async def bound(*args, **kwargs):
+            return await tool(*args, server=server, **kwargs)
+    else:
+        @functools.wraps(tool)
+        def bound(*args, **kwargs):
+            return tool(*args, server=server, **kwargs)
+    
+    bound.__signature__ = signature.replace(
+        parameters=[param for name, param in signature.parameters.items() if name != "server"]
+    )
+    bound.__annotations__ = {name: annotation for name, annotation in tool.__annotations__.items()
+                             if name != "server"}
+    return bound
+
+def create_server(server: ServerContext = _DEFAULT_SERVER):
+    """Create a Symmetra FastMCP server for one context/project and register its tools
+    
+    The context is bound into that server's tools, so several servers with
+    different contexts can live in one process.
+    """
+    from fastmcp import FastMCP
+    
+    mcp = FastMCP("Symmetra", tool_serializer=get_tool_serializer())
+    for tool in (get_guidance_tool, search_rules_tool, list_rule_categories_tool,
+                 detect_issues_tool, analyze_code_context_tool, batch_analyze_issues_tool,
+                 get_detection_info_tool, get_symmetra_help_tool, reset_caches_tool, batch_execute_tool):
+        mcp.tool(_bind_server(tool, server) if _takes_server(tool) else tool)
+    mcp.resource("symmetra://rules")(get_rules)
+    mcp.prompt(review_code)
+    return mcp
+
+def get_server():
+    """Return the shared Symmetra server, creating it (default context) on first use"""
+    global _mcp
+    if _mcp is None:
+        _mcp = create_server()
+    return _mcp
+
+def __getattr__(name: str):
+    # Module-level ``mcp`` is built lazily so fastmcp loads only when serving
+    if name == "mcp":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def main(context: str = "desktop-app", project: str = None):
     """Main entry point for the MCP server"""
     import sys
-    global _server_context, _server_project
+    global _mcp
     
-    print(f"🛡️ Starting Symmetra MCP Server (Refactored)...", file=sys.stderr)
-    print(f"🎯 Context: {context}", file=sys.stderr)
+    # One write, so the banner costs a single syscall before stdio is served
+    banner = f"🛡️ Starting Symmetra MCP Server (Refactored)...\n🎯 Context: {context}\n"
     if project:
-        print(f"📁 Project: {project}", file=sys.stderr)
+        banner += f"📁 Project: {project}\n"
+    sys.stderr.write(banner)
+    sys.stderr.flush()
     
-    # Store context and project globally
-    _server_context = context
-    _server_project = project
+    # The server's tools are bound to this context and project
+    _mcp = create_server(ServerContext(context, project))
     
-    mcp.run()  # Default: stdio transport
+    _mcp.run()  # Default: stdio transport
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
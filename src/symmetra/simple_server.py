@@ -7,10 +7,17 @@ complex deterministic rule systems.
 """
 
 import asyncio
+import functools
+import json
 import logging
+from itertools import islice
 from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP
 from symmetra.ai_guidance import guidance_engine, secret_detector
+from symmetra.keyword_matcher import KeywordMatcher
+from symmetra.result_cache import ResultCache, copy_result, input_digest
+from symmetra.readonly import ReadOnlyDict
+from symmetra.serialization import get_tool_serializer
 
 
 # Configure logging
@@ -18,11 +25,178 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create MCP server
-mcp = FastMCP("Symmetra")
+mcp = FastMCP("Symmetra", tool_serializer=get_tool_serializer())
+
+# Recent get_guidance results, keyed by a digest of every input (copy before returning)
+_guidance_cache = ResultCache(maxsize=512)
+
+# Keyword groups analyze_codebase looks for, each text matched in one scan
+_CODEBASE_ACTION_MATCHER = KeywordMatcher({
+    "auth": ('auth', 'login', 'user', 'session', 'token', 'password'),
+    "api": ('api', 'endpoint', 'route', 'controller'),
+    "database": ('database', 'db', 'schema', 'model', 'query'),
+    "performance": ('performance', 'cache', 'optimize', 'speed'),
+    "security": ('security', 'secure', 'vulnerability'),
+})
+_CODEBASE_CONTEXT_MATCHER = KeywordMatcher({
+    "framework": ('fastapi', 'flask', 'django', 'express'),
+    "database": ('postgres', 'mysql', 'mongodb', 'redis'),
+})
+
+# Files to ask for per action topic, in priority order (the first match wins)
+_CODEBASE_FILE_REQUESTS = (
+    ("auth", (
+        "Authentication/login related files (routes, controllers, middleware)",
+        "User model/schema files",
+        "Authentication configuration files",
+        "Any existing JWT/session management code",
+        "Database migration files for user tables"
+    )),
+    ("api", (
+        "API route definition files",
+        "Controller/handler files", 
+        "API middleware files",
+        "Request validation/serialization code",
+        "API configuration and error handling"
+    )),
+    ("database", (
+        "Database model/schema definition files",
+        "Database configuration files",
+        "Migration files",
+        "Query builder or ORM configuration",
+        "Database connection and pooling setup"
+    )),
+    ("performance", (
+        "Main application entry points",
+        "Frequently called functions/methods",
+        "Database query files",
+        "Caching configuration",
+        "Performance-critical code paths"
+    )),
+    ("security", (
+        "Authentication and authorization code",
+        "Input validation and sanitization",
+        "Configuration files with security settings",
+        "API endpoint handlers",
+        "Database access and query code"
+    )),
+)
+_GENERAL_FILE_REQUESTS = (
+    "Main application files (entry points, core logic)",
+    "Configuration files",
+    "Key business logic files",
+    "Database/data access files",
+    "Any files you think are most relevant to the task"
+)
+
+# Simple knowledge base - could be expanded with real search
+# (category, rules) pairs, shared by every search_rules call
+_KNOWLEDGE_BASE = (
+    ("authentication", (
+        "Use OAuth 2.0 or JWT for modern authentication",
+        "Implement proper password hashing with bcrypt or Argon2",
+        "Add rate limiting to prevent brute force attacks",
+        "Consider multi-factor authentication for sensitive data"
+    )),
+    ("database", (
+        "Use connection pooling for better performance",
+        "Implement proper indexing strategy",
+        "Use parameterized queries to prevent SQL injection",
+        "Plan for database migrations and schema versioning"
+    )),
+    ("api", (
+        "Follow RESTful conventions or GraphQL best practices",
+        "Implement proper error handling and status codes",
+        "Use API versioning strategy",
+        "Add request/response validation"
+    )),
+    ("security", (
+        "Follow OWASP Top 10 security guidelines",
+        "Implement input validation and sanitization",
+        "Use HTTPS everywhere and secure headers",
+        "Apply principle of least privilege"
+    )),
+    ("performance", (
+        "Profile before optimizing - measure bottlenecks",
+        "Implement caching at appropriate layers",
+        "Use database query optimization",
+        "Consider asynchronous processing for heavy operations"
+    )),
+)
+
+# A category matches when it, or any word of it, occurs in the query
+_KNOWLEDGE_MATCHER = KeywordMatcher({
+    category: (category, *category.split()) for category, _ in _KNOWLEDGE_BASE
+})
+
+# Categories listed by list_rule_categories (shared read-only result)
+_RULE_CATEGORIES = (
+    "authentication",
+    "database", 
+    "api",
+    "security",
+    "performance",
+    "architecture",
+    "design_patterns"
+)
+_CATEGORIES_RESULT = ReadOnlyDict({
+    "categories": _RULE_CATEGORIES,
+    "count": len(_RULE_CATEGORIES)
+})
+
+# The help payload never changes, so it is built once, frozen and shared by every call
+_HELP_CONTENT = ReadOnlyDict({
+    "overview": "Symmetra provides AI-powered architectural guidance for software development",
+
+    "primary_tool": ReadOnlyDict({
+        "name": "get_guidance",
+        "description": "Main tool for architectural analysis and recommendations",
+        "when_to_use": (
+            "Before implementing new features",
+            "When designing system architecture", 
+            "For code review and refactoring",
+            "When choosing design patterns",
+            "For security and performance guidance"
+        )
+    }),
+
+    "best_practices": (
+        "Be specific about what you're trying to accomplish",
+        "Provide relevant code context when asking for guidance",
+        "Include information about your project type and constraints",
+        "Ask for guidance early in the development process",
+        "Use Symmetra for both new development and refactoring"
+    ),
+
+    "example_requests": (
+        "Get guidance for implementing user authentication with JWT",
+        "Review this API endpoint for security and performance",
+        "Suggest database schema design for e-commerce orders",
+        "Help me refactor this large class into smaller components",
+        "What's the best caching strategy for this use case?"
+    ),
+
+    "tools_overview": ReadOnlyDict({
+        "get_guidance": "AI-powered architectural analysis and recommendations",
+        "scan_secrets": "Security scanning for hardcoded credentials",
+        "search_rules": "Search architectural knowledge base",
+        "list_rule_categories": "View available guidance categories"
+    })
+})
+
+# The same static payloads as JSON text, served as resources that clients can cache
+_HELP_JSON = json.dumps(_HELP_CONTENT)
+_CATEGORIES_JSON = json.dumps(_CATEGORIES_RESULT)
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking call in the default executor so the event loop keeps serving requests"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
 
 
 @mcp.tool()
-def get_guidance(action: str, code: str = "", context: str = "", project_id: str = None) -> Dict[str, Any]:
+async def get_guidance(action: str, code: str = "", context: str = "", project_id: str = None) -> Dict[str, Any]:
     """
     🎯 Get comprehensive architectural guidance for coding actions
     
@@ -61,12 +235,22 @@ def get_guidance(action: str, code: str = "", context: str = "", project_id: str
         "Suggest database schema design for e-commerce orders"
     """
     try:
-        logger.info(f"Providing guidance for action: {action}")
-        response = guidance_engine.get_guidance(action, code, context, project_id)
-        return response.to_dict()
+        logger.info("Providing guidance for action: %s", action)
         
-    except Exception as e:
-        logger.error(f"Error in get_guidance: {e}")
+        # Agents retry and iterate on the same query; serve repeats from cache
+        key = input_digest(code, action, context, project_id)
+        result = _guidance_cache.get(key)
+        if result is None:
+            # Vector search and code scans block; run them off the event loop
+            response = await _run_blocking(guidance_engine.get_guidance, action, code, context, project_id)
+            result = response.to_dict()
+            # Fallbacks served after a failure are not cached, so the next call retries
+            if not response.degraded:
+                _guidance_cache.put(key, result)
+        return copy_result(result)
+        
+    except Exception:
+        logger.exception("Error in get_guidance")
         return {
             "guidance": ["Unable to provide guidance at this time"],
             "status": "advisory",
@@ -77,7 +261,7 @@ def get_guidance(action: str, code: str = "", context: str = "", project_id: str
 
 
 @mcp.tool()
-def scan_secrets(code: str) -> Dict[str, Any]:
+async def scan_secrets(code: str) -> Dict[str, Any]:
     """
     🔍 Scan code for potential hardcoded secrets and credentials
     
@@ -97,8 +281,41 @@ def scan_secrets(code: str) -> Dict[str, Any]:
         - count: Number of issues detected
         - status: "clean" or "issues_found"
     """
+    logger.info("Scanning code for potential secrets")
+    return await _run_blocking(_scan_secrets_result, code)
+
+
+@mcp.tool()
+async def scan_secrets_batch(codes: List[str]) -> Dict[str, Any]:
+    """
+    🔍 Scan several code snippets for hardcoded secrets in one call
+    
+    Use this instead of calling scan_secrets once per snippet (for example
+    when checking every changed file): one request covers all of them.
+    
+    Args:
+        codes: The code snippets to scan
+        
+    Returns:
+        Dictionary containing:
+        - results: One scan_secrets result per snippet, in input order
+        - total_count: Number of issues detected across all snippets
+        - status: "clean", "issues_found", or "error" if any snippet failed to scan
+    """
+    logger.info("Scanning %d code snippets for potential secrets", len(codes))
+    results = await _run_blocking(lambda: [_scan_secrets_result(code) for code in codes])
+    statuses = {result["status"] for result in results}
+    
+    return {
+        "results": results,
+        "total_count": sum(result["count"] for result in results),
+        "status": next((status for status in ("error", "issues_found") if status in statuses), "clean")
+    }
+
+
+def _scan_secrets_result(code: str) -> Dict[str, Any]:
+    """Scan one snippet and shape the scan_secrets result"""
     try:
-        logger.info("Scanning code for potential secrets")
         secrets = secret_detector.scan_secrets(code)
         
         return {
@@ -108,7 +325,7 @@ def scan_secrets(code: str) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Error in scan_secrets: {e}")
+        logger.error("Error in scan_secrets: %s", e)
         return {
             "secrets": [],
             "count": 0,
@@ -132,62 +349,34 @@ def search_rules(query: str, max_results: int = 5) -> Dict[str, Any]:
         Dictionary with matching rules and their relevance
     """
     try:
-        logger.info(f"Searching rules for: {query}")
+        logger.info("Searching rules for: %s", query)
         
-        # Simple knowledge base - could be expanded with real search
-        knowledge_base = {
-            "authentication": [
-                "Use OAuth 2.0 or JWT for modern authentication",
-                "Implement proper password hashing with bcrypt or Argon2",
-                "Add rate limiting to prevent brute force attacks",
-                "Consider multi-factor authentication for sensitive data"
-            ],
-            "database": [
-                "Use connection pooling for better performance",
-                "Implement proper indexing strategy",
-                "Use parameterized queries to prevent SQL injection",
-                "Plan for database migrations and schema versioning"
-            ],
-            "api": [
-                "Follow RESTful conventions or GraphQL best practices",
-                "Implement proper error handling and status codes",
-                "Use API versioning strategy",
-                "Add request/response validation"
-            ],
-            "security": [
-                "Follow OWASP Top 10 security guidelines",
-                "Implement input validation and sanitization",
-                "Use HTTPS everywhere and secure headers",
-                "Apply principle of least privilege"
-            ],
-            "performance": [
-                "Profile before optimizing - measure bottlenecks",
-                "Implement caching at appropriate layers",
-                "Use database query optimization",
-                "Consider asynchronous processing for heavy operations"
-            ]
-        }
+        # One scan of the query finds every category named in it
+        hits = _KNOWLEDGE_MATCHER.match(query.lower())
+        matched = [(category, rules[:max_results]) for category, rules in _KNOWLEDGE_BASE if category in hits]
+        total_found = sum(len(rules) for _, rules in matched)
         
-        query_lower = query.lower()
-        results = []
-        
-        for category, rules in knowledge_base.items():
-            if category in query_lower or any(word in query_lower for word in category.split()):
-                for rule in rules[:max_results]:
-                    results.append({
-                        "category": category,
-                        "rule": rule,
-                        "relevance": 0.9  # Simple relevance score
-                    })
+        # Build result entries only for the rules that are returned (slice semantics,
+        # so a negative max_results still drops that many from the end)
+        limit = max_results if max_results >= 0 else max(total_found + max_results, 0)
+        matched_rules = ((category, rule) for category, rules in matched for rule in rules)
+        results = [
+            {
+                "category": category,
+                "rule": rule,
+                "relevance": 0.9  # Simple relevance score
+            }
+            for category, rule in islice(matched_rules, limit)
+        ]
         
         return {
-            "results": results[:max_results],
+            "results": results,
             "query": query,
-            "total_found": len(results)
+            "total_found": total_found
         }
         
     except Exception as e:
-        logger.error(f"Error in search_rules: {e}")
+        logger.error("Error in search_rules: %s", e)
         return {
             "results": [],
             "query": query,
@@ -203,20 +392,7 @@ def list_rule_categories() -> Dict[str, Any]:
     Returns all rule categories available in Symmetra's knowledge base,
     helping you understand what types of guidance are available.
     """
-    categories = [
-        "authentication",
-        "database", 
-        "api",
-        "security",
-        "performance",
-        "architecture",
-        "design_patterns"
-    ]
-    
-    return {
-        "categories": categories,
-        "count": len(categories)
-    }
+    return _CATEGORIES_RESULT
 
 
 @mcp.tool()
@@ -250,74 +426,23 @@ def analyze_codebase(action: str, context: str = "", project_id: str = None) ->
         "Assess my database schema design for scalability"
     """
     try:
-        logger.info(f"Analyzing codebase for action: {action}")
+        logger.info("Analyzing codebase for action: %s", action)
         
         # Determine what code files would be most relevant for analysis
-        action_lower = action.lower()
-        context_lower = context.lower()
+        action_topics = _CODEBASE_ACTION_MATCHER.match(action.lower())
+        context_topics = _CODEBASE_CONTEXT_MATCHER.match(context.lower())
         
         # Build specific file requests based on the action
-        file_requests = []
-        
-        if any(word in action_lower for word in ['auth', 'login', 'user', 'session', 'token', 'password']):
-            file_requests.extend([
-                "Authentication/login related files (routes, controllers, middleware)",
-                "User model/schema files",
-                "Authentication configuration files",
-                "Any existing JWT/session management code",
-                "Database migration files for user tables"
-            ])
-            
-        elif any(word in action_lower for word in ['api', 'endpoint', 'route', 'controller']):
-            file_requests.extend([
-                "API route definition files",
-                "Controller/handler files", 
-                "API middleware files",
-                "Request validation/serialization code",
-                "API configuration and error handling"
-            ])
-            
-        elif any(word in action_lower for word in ['database', 'db', 'schema', 'model', 'query']):
-            file_requests.extend([
-                "Database model/schema definition files",
-                "Database configuration files",
-                "Migration files",
-                "Query builder or ORM configuration",
-                "Database connection and pooling setup"
-            ])
-            
-        elif any(word in action_lower for word in ['performance', 'cache', 'optimize', 'speed']):
-            file_requests.extend([
-                "Main application entry points",
-                "Frequently called functions/methods",
-                "Database query files",
-                "Caching configuration",
-                "Performance-critical code paths"
-            ])
-            
-        elif any(word in action_lower for word in ['security', 'secure', 'vulnerability']):
-            file_requests.extend([
-                "Authentication and authorization code",
-                "Input validation and sanitization",
-                "Configuration files with security settings",
-                "API endpoint handlers",
-                "Database access and query code"
-            ])
-        else:
-            # General analysis
-            file_requests.extend([
-                "Main application files (entry points, core logic)",
-                "Configuration files",
-                "Key business logic files",
-                "Database/data access files",
-                "Any files you think are most relevant to the task"
-            ])
+        file_requests = list(next(
+            (requests for topic, requests in _CODEBASE_FILE_REQUESTS if topic in action_topics),
+            _GENERAL_FILE_REQUESTS
+        ))
         
         # Add technology-specific requests
-        if any(tech in context_lower for tech in ['fastapi', 'flask', 'django', 'express']):
+        if "framework" in context_topics:
             file_requests.append("Framework-specific configuration and setup files")
             
-        if any(db in context_lower for db in ['postgres', 'mysql', 'mongodb', 'redis']):
+        if "database" in context_topics:
             file_requests.append("Database-specific configuration and connection files")
         
         return {
@@ -355,7 +480,7 @@ def analyze_codebase(action: str, context: str = "", project_id: str = None) ->
         }
         
     except Exception as e:
-        logger.error(f"Error in analyze_codebase: {e}")
+        logger.error("Error in analyze_codebase: %s", e)
         return {
             "guidance": ["Unable to analyze codebase at this time"],
             "status": "error",
@@ -378,54 +503,79 @@ def get_symmetra_help() -> Dict[str, Any]:
     
     Returns:
         Complete guide on Symmetra usage, capabilities, and best practices
+        (a shared read-only constant; copy it before modifying)
     """
-    help_content = {
-        "overview": "Symmetra provides AI-powered architectural guidance for software development",
-        
-        "primary_tool": {
-            "name": "get_guidance",
-            "description": "Main tool for architectural analysis and recommendations",
-            "when_to_use": [
-                "Before implementing new features",
-                "When designing system architecture", 
-                "For code review and refactoring",
-                "When choosing design patterns",
-                "For security and performance guidance"
-            ]
-        },
-        
-        "best_practices": [
-            "Be specific about what you're trying to accomplish",
-            "Provide relevant code context when asking for guidance",
-            "Include information about your project type and constraints",
-            "Ask for guidance early in the development process",
-            "Use Symmetra for both new development and refactoring"
-        ],
-        
-        "example_requests": [
-            "Get guidance for implementing user authentication with JWT",
-            "Review this API endpoint for security and performance",
-            "Suggest database schema design for e-commerce orders",
-            "Help me refactor this large class into smaller components",
-            "What's the best caching strategy for this use case?"
-        ],
+    return _HELP_CONTENT
+
+
+@mcp.tool()
+async def batch_execute(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    📦 Run several Symmetra tools in one request
+    
+    Use this when you need more than one Symmetra tool at once (for example
+    guidance for an action plus a secret scan of the related code). All calls
+    run concurrently and the results come back in the order given, saving one
+    round trip per extra call.
+    
+    Args:
+        calls: Up to 64 {"tool": name, "args": {...}} entries. Tool names:
+               get_guidance, scan_secrets, scan_secrets_batch, search_rules,
+               list_rule_categories, analyze_codebase, get_symmetra_help
         
-        "tools_overview": {
-            "get_guidance": "AI-powered architectural analysis and recommendations",
-            "scan_secrets": "Security scanning for hardcoded credentials",
-            "search_rules": "Search architectural knowledge base",
-            "list_rule_categories": "View available guidance categories"
-        }
-    }
+    Returns:
+        Dictionary with:
+        - results: One {"tool", "ok", "result" or "error"} entry per call, in input order
+        - succeeded: Number of calls that completed
+        - failed: Number of calls that raised an error
+    """
+    if len(calls) > _MAX_BATCH_CALLS:
+        raise ValueError(f"A batch may hold at most {_MAX_BATCH_CALLS} calls, got {len(calls)}")
+    
+    async def run(call: Dict[str, Any]) -> Dict[str, Any]:
+        # A malformed entry fails on its own instead of failing the whole batch
+        name = call.get("tool") if isinstance(call, dict) else None
+        try:
+            if not isinstance(call, dict):
+                raise ValueError("Each call must be an object with a 'tool' name")
+            if not isinstance(name, str) or name not in _BATCH_TOOLS:
+                raise ValueError(f"Unknown tool: {name}")
+            args = call.get("args") or {}
+            if not isinstance(args, dict):
+                raise ValueError("'args' must be an object of keyword arguments")
+            result = _BATCH_TOOLS[name](**args)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except Exception as e:
+            return {"tool": name, "ok": False, "error": str(e)}
+        return {"tool": name, "ok": True, "result": result}
     
-    return help_content
+    results = await asyncio.gather(*(run(call) for call in calls))
+    succeeded = sum(1 for result in results if result["ok"])
+    return {"results": results, "succeeded": succeeded, "failed": len(results) - succeeded}
+
+
+# Largest batch_execute request accepted
+_MAX_BATCH_CALLS = 64
+
+# Tools reachable through batch_execute, by name. fastmcp's decorator returns a
+# tool object wrapping the function; call the function itself
+_BATCH_TOOLS = {
+    name: getattr(tool, "fn", tool)
+    for name, tool in (
+        ("get_guidance", get_guidance),
+        ("scan_secrets", scan_secrets),
+        ("scan_secrets_batch", scan_secrets_batch),
+        ("search_rules", search_rules),
+        ("list_rule_categories", list_rule_categories),
+        ("analyze_codebase", analyze_codebase),
+        ("get_symmetra_help", get_symmetra_help),
+    )
+}
 
 
 # Resources for Claude Code integration
-@mcp.resource("symmetra://rules")
-def get_rules_resource() -> str:
-    """Architectural rules and guidelines resource"""
-    return """
+_RULES_RESOURCE = """
 # Symmetra Architectural Rules and Guidelines
 
 ## Security Best Practices
@@ -465,10 +615,13 @@ def get_rules_resource() -> str:
 """
 
 
-@mcp.resource("symmetra://patterns")
-def get_patterns_resource() -> str:
-    """Design pattern recommendations resource"""
-    return """
+@mcp.resource("symmetra://rules")
+def get_rules_resource() -> str:
+    """Architectural rules and guidelines resource"""
+    return _RULES_RESOURCE
+
+
+_PATTERNS_RESOURCE = """
 # Symmetra Design Pattern Recommendations
 
 ## Authentication Patterns
@@ -498,10 +651,13 @@ def get_patterns_resource() -> str:
 """
 
 
-@mcp.resource("symmetra://checklist")
-def get_checklist_resource() -> str:
-    """Code review checklist resource"""
-    return """
+@mcp.resource("symmetra://patterns")
+def get_patterns_resource() -> str:
+    """Design pattern recommendations resource"""
+    return _PATTERNS_RESOURCE
+
+
+_CHECKLIST_RESOURCE = """
 # Symmetra Code Review Checklist
 
 ## Security Review
@@ -534,6 +690,37 @@ def get_checklist_resource() -> str:
 """
 
 
+@mcp.resource("symmetra://checklist")
+def get_checklist_resource() -> str:
+    """Code review checklist resource"""
+    return _CHECKLIST_RESOURCE
+
+
+@mcp.resource("symmetra://help", mime_type="application/json")
+def get_help_resource() -> str:
+    """Symmetra usage guide resource (same content as get_symmetra_help)"""
+    return _HELP_JSON
+
+
+@mcp.resource("symmetra://categories", mime_type="application/json")
+def get_categories_resource() -> str:
+    """Rule categories resource (same content as list_rule_categories)"""
+    return _CATEGORIES_JSON
+
+
+@mcp.resource("symmetra://cache-stats")
+def get_cache_stats_resource() -> str:
+    """Guidance cache size and hit counts resource"""
+    return json.dumps({
+        "guidance_cache": {
+            "size": len(_guidance_cache),
+            "maxsize": _guidance_cache.maxsize,
+            "hits": _guidance_cache.hits,
+            "misses": _guidance_cache.misses
+        }
+    })
+
+
 def run_server():
     """Run the simplified Symmetra MCP server"""
     logger.info("Starting Symmetra Simple MCP Server")
@@ -5,22 +5,43 @@ This package contains all MCP tools organized by functionality:
 - guidance_tools: Traditional architectural guidance and best practices
 - detection_tools: Code issue detection and analysis
 - help_tools: Documentation and usage guidance
+
+Submodules are imported on first use of one of their tools, so a caller that
+only needs guidance never loads the detection engine and analyzers.
 """
 
-from .guidance_tools import get_guidance, search_rules, list_rule_categories
-from .detection_tools import (
-    detect_issues, 
-    analyze_code_context, 
-    batch_analyze_issues, 
-    get_detection_info
-)
-from .help_tools import get_symmetra_help, get_rules_resource, get_review_code_prompt
+import importlib
+
+# Public tool name -> submodule that defines it
+_TOOL_MODULES = {
+    'get_guidance': 'guidance_tools',
+    'search_rules': 'guidance_tools',
+    'list_rule_categories': 'guidance_tools',
+    'reset_caches': 'guidance_tools',
+    'detect_issues': 'detection_tools',
+    'analyze_code_context': 'detection_tools',
+    'batch_analyze_issues': 'detection_tools',
+    'get_detection_info': 'detection_tools',
+    'get_symmetra_help': 'help_tools',
+    'get_rules_resource': 'help_tools',
+    'get_review_code_prompt': 'help_tools',
+}
+
+
+def __getattr__(name: str):
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip this hook
+    return value
 
 __all__ = [
     # Guidance tools
     'get_guidance',
     'search_rules', 
     'list_rule_categories',
+    'reset_caches',
     
     # Detection tools
     'detect_issues',
@@ -5,9 +5,12 @@ This module contains the new hybrid detection tools that find concrete,
 actionable issues in code using pattern matching, AST analysis, and LLM enhancement.
 """
 
+import os
 from typing import Dict, Any, List, Optional
 from ..detectors import create_detection_engine
 from ..analyzers import LLMAnalyzer, ReportGenerator, ContextExtractor
+from ..disk_cache import cached_call
+from ..result_cache import ResultCache, copy_result, input_digest
 
 # Initialize detection components
 detection_engine = create_detection_engine()
@@ -15,9 +18,57 @@ llm_analyzer = LLMAnalyzer()
 report_generator = ReportGenerator()
 context_extractor = ContextExtractor()
 
-def detect_issues(code: str, file_path: str = "unknown.py", language: str = None, 
+# Report formats batch_analyze_issues renders when the caller doesn't pick any
+_BATCH_REPORT_TYPES = ("summary", "ide_assistant", "agent", "desktop_app")
+
+# Recent detect_issues / batch_analyze_issues results, keyed by a digest of every input
+_detection_cache = ResultCache(maxsize=256)
+
+# Recent detection engine results, shared by both tools (agents often run
+# detect_issues and then batch_analyze_issues on the same buffer)
+_analysis_cache = ResultCache(maxsize=128)
+
+def _read_code_file(code_path: str, project_root: Optional[str]) -> str:
+    """Read a source file to analyze, so large files need not travel through the request
+    
+    Only files inside the server's project directory can be read (relative
+    paths are taken from it); the tool is reachable by any MCP client, so
+    failures never reveal whether a path exists.
+    """
+    if not project_root:
+        raise ValueError("code_path requires the server to be started with a project directory")
+    root = os.path.realpath(project_root)
+    path = os.path.realpath(os.path.join(root, code_path))
+    if os.path.commonpath((root, path)) != root:
+        raise ValueError("code_path must be inside the project directory")
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        raise ValueError("code_path must name a readable file in the project directory") from None
+
+def _analyze(code: str, file_path: str, project_context: dict):
+    """Run the detection engine, reusing the result of an identical recent analysis
+    
+    The DetectionResult may be shared between calls and must be treated as
+    read-only. Like the engine, this records the detected language in
+    project_context. Analyses where a detector failed are not reused, so a
+    transient failure is retried instead of being served as a partial result.
+    """
+    key = input_digest(code, file_path, sorted(project_context.items()))
+    result = _analysis_cache.get(key)
+    if result is None:
+        result = detection_engine.analyze_code(code, file_path, project_context)
+        if not result.detectors_failed:
+            _analysis_cache.put(key, result)
+    else:
+        project_context['language'] = result.language
+    return result
+
+def detect_issues(code: str = "", file_path: str = "unknown.py", language: str = None, 
                  report_type: str = "summary", project_context: dict = None,
-                 server_context: str = None, server_project: str = None) -> dict:
+                 server_context: str = None, server_project: str = None,
+                 code_path: str = None) -> dict:
     """
     🔍 Detect specific code issues using hybrid analysis
     
@@ -38,6 +89,7 @@ def detect_issues(code: str, file_path: str = "unknown.py", language: str = None
         project_context: Additional project context (environment, framework, etc.)
         server_context: Server context (ide-assistant, agent, desktop-app)
         server_project: Project directory path
+        code_path: Path of a file inside server_project to analyze instead of passing its contents as code
         
     Returns:
         Comprehensive detection results with:
@@ -51,22 +103,49 @@ def detect_issues(code: str, file_path: str = "unknown.py", language: str = None
         "Analyze this 500-line file for maintainability issues"
         "Scan this API endpoint for common code problems"
     """
-    if project_context is None:
-        project_context = {}
+    if code_path:
+        code = _read_code_file(code_path, server_project)
+        if file_path == "unknown.py":
+            file_path = code_path
     
-    # Add global context
-    project_context.update({
+    # Add global context to a fresh dict; the caller's dict is left untouched
+    project_context = {
+        **(project_context or {}),
         "server_context": server_context,
         "project": server_project,
         "language": language
-    })
+    }
     
+    key = input_digest(code, "detect_issues", file_path, report_type, project_context)
+    response = _detection_cache.get(key)
+    if response is None:
+        response = cached_call(
+            "detect_issues",
+            lambda: _build_detection(code, file_path, report_type, project_context),
+            code, file_path, report_type, project_context,
+            cacheable=_detection_complete,
+        )
+        # A detector failure may be transient; retry it next time rather than pin a partial result
+        if _detection_complete(response):
+            _detection_cache.put(key, response)
+    return copy_result(response)
+
+def _detection_complete(response: dict) -> bool:
+    """Whether every detector finished for a detect_issues result"""
+    return not response["analysis_summary"].get("detectors_failed")
+
+def _build_detection(code: str, file_path: str, report_type: str, project_context: dict) -> dict:
+    """Compute the detect_issues result"""
     # Run detection analysis
-    result = detection_engine.analyze_code(code, file_path, project_context)
+    result = _analyze(code, file_path, project_context)
     
     # Generate formatted report
     report = report_generator.generate_report(result, report_type=report_type, context=project_context)
     
+    # Severity views are recomputed on every property access; take them once
+    critical_issues = result.critical_issues
+    high_issues = result.high_issues
+    
     return {
         "detection_results": {
             "file_path": result.file_path,
@@ -78,8 +157,8 @@ def detect_issues(code: str, file_path: str = "unknown.py", language: str = None
         },
         "issues": [
             {
-                "type": issue.type.value,
-                "severity": issue.severity.value,
+                "type": issue.type_value,
+                "severity": issue.severity_value,
                 "line_number": issue.line_number,
                 "message": issue.message,
                 "evidence": issue.evidence,
@@ -92,17 +171,18 @@ def detect_issues(code: str, file_path: str = "unknown.py", language: str = None
         "analysis_summary": {
             "total_issues": len(result.issues),
             "issue_breakdown": result.issue_count_by_severity,
-            "critical_issues": len(result.critical_issues),
-            "high_priority_issues": len(result.high_issues),
-            "has_blocking_issues": result.has_blocking_issues,
+            "critical_issues": len(critical_issues),
+            "high_priority_issues": len(high_issues),
+            "has_blocking_issues": bool(critical_issues),
             "detectors_run": result.detectors_run,
+            "detectors_failed": result.detectors_failed,
             "patterns_checked": result.patterns_checked
         },
         "guidance": result.guidance,
         "formatted_report": report,
         "next_steps": {
-            "immediate_action": "Fix critical issues first" if result.critical_issues else "Review high-priority issues",
-            "estimated_effort": f"{len(result.critical_issues) * 20 + len(result.high_issues) * 15} minutes",
+            "immediate_action": "Fix critical issues first" if critical_issues else "Review high-priority issues",
+            "estimated_effort": f"{len(critical_issues) * 20 + len(high_issues) * 15} minutes",
             "testing_needed": len(result.issues) > 0
         }
     }
@@ -132,10 +212,12 @@ def analyze_code_context(code: str, line_number: int = None, language: str = Non
     if focus_keywords is None:
         focus_keywords = []
     
+    # Only the count is needed here; the extractor splits the code itself
+    total_lines = code.count('\n') + 1
+    
     if line_number is None:
         # If no specific line, analyze the middle of the code
-        lines = code.split('\n')
-        line_number = len(lines) // 2
+        line_number = total_lines // 2
     
     context_result = context_extractor.extract_context(
         code=code,
@@ -155,7 +237,7 @@ def analyze_code_context(code: str, line_number: int = None, language: str = Non
         "context_analysis": context_result,
         "function_context": function_context,
         "metadata": {
-            "total_lines": len(code.split('\n')),
+            "total_lines": total_lines,
             "focus_line": line_number,
             "language": language,
             "keywords_highlighted": len(focus_keywords)
@@ -164,7 +246,8 @@ def analyze_code_context(code: str, line_number: int = None, language: str = Non
 
 def batch_analyze_issues(code: str, file_path: str = "unknown.py", 
                         enable_llm_analysis: bool = False, project_context: dict = None,
-                        server_context: str = None, server_project: str = None) -> dict:
+                        server_context: str = None, server_project: str = None,
+                        report_types: list = None) -> dict:
     """
     🧠 Perform comprehensive batch analysis with optional LLM enhancement
     
@@ -179,6 +262,8 @@ def batch_analyze_issues(code: str, file_path: str = "unknown.py",
         project_context: Additional project context and constraints
         server_context: Server context (ide-assistant, agent, desktop-app)
         server_project: Project directory path
+        report_types: Report formats to render into report_formats (default: summary,
+                      ide_assistant, agent and desktop_app); each one costs a full report pass
         
     Returns:
         Comprehensive analysis with:
@@ -188,31 +273,43 @@ def batch_analyze_issues(code: str, file_path: str = "unknown.py",
         - patterns: Identified code patterns and issues
         - report_options: Different report formats available
     """
-    if project_context is None:
-        project_context = {}
-    
-    # Add global context
-    project_context.update({
+    # Add global context to a fresh dict; the caller's dict is left untouched
+    project_context = {
+        **(project_context or {}),
         "server_context": server_context,
         "project": server_project
-    })
+    }
+    # Same context shape as detect_issues, so both tools share cached analyses
+    project_context.setdefault("language", None)
+    
+    report_types = _BATCH_REPORT_TYPES if report_types is None else tuple(report_types)
+    
+    key = input_digest(code, "batch_analyze_issues", file_path, enable_llm_analysis, report_types,
+                       project_context)
+    cached = _detection_cache.get(key)
+    if cached is not None:
+        return copy_result(cached)
     
     # Run detection analysis
-    result = detection_engine.analyze_code(code, file_path, project_context)
+    result = _analyze(code, file_path, project_context)
     
     analysis_data = None
     if enable_llm_analysis and result.issues:
         # Perform LLM analysis on detected issues
         analysis_data = llm_analyzer.batch_analyze(result.issues, code, project_context)
     
-    # Generate different report formats
+    # Generate only the requested report formats
     report_formats = {}
-    for report_type in ["summary", "ide_assistant", "agent", "desktop_app"]:
+    for report_type in report_types:
         report_formats[report_type] = report_generator.generate_report(
             result, analysis_data, report_type, project_context
         )
     
-    return {
+    # Severity views are recomputed on every property access; take them once
+    critical_issues = result.critical_issues
+    high_issues = result.high_issues
+    
+    response = {
         "batch_analysis": {
             "detection_summary": {
                 "total_issues": len(result.issues),
@@ -220,10 +317,10 @@ def batch_analyze_issues(code: str, file_path: str = "unknown.py",
                 "status": result.status,
                 "complexity": result.complexity_score
             },
-            "issue_categories": [issue.type.value for issue in result.issues],
+            "issue_categories": [issue.type_value for issue in result.issues],
             "priority_issues": [
                 {
-                    "type": issue.type.value,
+                    "type": issue.type_value,
                     "line": issue.line_number,
                     "message": issue.message,
                     "fix": issue.fix_suggestion
@@ -233,18 +330,21 @@ def batch_analyze_issues(code: str, file_path: str = "unknown.py",
         },
         "llm_analysis": analysis_data if enable_llm_analysis else None,
         "recommendations": {
-            "immediate": [f"Fix {issue.type.value}" for issue in result.critical_issues[:3]],
-            "short_term": [f"Address {issue.type.value}" for issue in result.high_issues[:3]],
+            "immediate": [f"Fix {issue.type_value}" for issue in critical_issues[:3]],
+            "short_term": [f"Address {issue.type_value}" for issue in high_issues[:3]],
             "long_term": ["Establish automated code quality checks", "Implement security scanning"]
         },
         "report_formats": report_formats,
         "next_actions": {
-            "critical_count": len(result.critical_issues),
-            "blocking_deployment": result.has_blocking_issues,
+            "critical_count": len(critical_issues),
+            "blocking_deployment": bool(critical_issues),
             "estimated_fix_time": f"{len(result.issues) * 15} minutes",
             "testing_required": "Run tests after each fix"
         }
     }
+    if not result.detectors_failed:
+        _detection_cache.put(key, response)
+    return copy_result(response)
 
 def get_detection_info() -> dict:
     """
@@ -275,7 +375,8 @@ def get_detection_info() -> dict:
             "supported_languages": statistics["supported_languages"],
             "total_detectors": statistics["total_detectors"],
             "enabled_detectors": statistics["enabled_detectors"],
-            "patterns_available": statistics["total_patterns_checked"]
+            "patterns_available": statistics["total_patterns_checked"],
+            "blank_inputs_skipped": statistics["blank_inputs_skipped"]
         },
         "detection_categories": {
             "security": ["hardcoded_secret", "sql_injection_risk", "insecure_protocol"],
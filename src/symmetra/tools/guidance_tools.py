@@ -5,18 +5,63 @@ This module contains the original Symmetra tools focused on providing
 general architectural guidance, best practices, and design recommendations.
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Any, Optional, Tuple
+
+from ..code_scan import scan_code
+from ..disk_cache import cached_call, clear_disk_cache
+from ..result_cache import ResultCache, copy_result, input_digest
+
+# Fallbacks used when no rule or code check produced anything
+_DEFAULT_GUIDANCE = (
+    "✅ No specific architectural concerns detected",
+    "🏗️ Follow established coding standards and best practices",
+    "🧪 Consider adding tests for new functionality",
+    "📝 Document complex logic and API interfaces"
+)
+_DEFAULT_PATTERNS = ("General Best Practices",)
+
+# Complexity is ranked as an int internally and named only in the result
+_COMPLEXITY_LEVELS = ("low", "medium", "high")
+
+# Recent get_guidance results, keyed by a digest of every input (copy before returning)
+_guidance_cache = ResultCache(maxsize=256)
+
+# Action-only queries shorter than this share a cache entry per normalized action
+_SHORT_ACTION_LENGTH = 32
 
 # Lazy initialization to avoid import-time dependencies
 _rule_engine = None
+# Batched tool calls run in threads; only one of them may build the engine
+_rule_engine_lock = Lock()
 
 def _get_rule_engine():
     global _rule_engine
     if _rule_engine is None:
-        from symmetra.rules_engine import create_rule_engine
-        _rule_engine = create_rule_engine("vector")
+        with _rule_engine_lock:
+            if _rule_engine is None:
+                from symmetra.rules_engine import create_rule_engine
+                _rule_engine = create_rule_engine("vector")
     return _rule_engine
 
+@lru_cache(maxsize=32)
+def _server_guidance(server_context: Optional[str], server_project: Optional[str]) -> Tuple[str, ...]:
+    """Guidance lines implied by the server context and project (fixed per server run)"""
+    guidance = []
+    if server_context == 'ide-assistant':
+        guidance.append("💡 IDE Integration: Consider adding IntelliSense-friendly type hints")
+        guidance.append("🔧 IDE Integration: Structure code for better refactoring support")
+    elif server_context == 'agent':
+        guidance.append("🤖 Agent Mode: Focus on automated code generation patterns")
+        guidance.append("🔄 Agent Mode: Design for programmatic modification")
+    
+    # Add project-specific guidance if project directory is available
+    if server_project:
+        guidance.append(f"📁 Project Context: Working in {server_project}")
+        # TODO: Add project-specific configuration loading from .symmetra.toml
+    return tuple(guidance)
+
 def get_guidance(action: str, code: str = "", context: str = "", 
                 server_context: str = None, server_project: str = None) -> dict:
     """
@@ -58,6 +103,44 @@ def get_guidance(action: str, code: str = "", context: str = "",
         "Review this 200-line component for architectural improvements"
         "Suggest database schema design for e-commerce orders"
     """
+    # Short "what should I do" prompts recur with varying case and padding;
+    # rule matching ignores both, so they share one entry
+    rule_action = action
+    if not code and not context and len(action) < _SHORT_ACTION_LENGTH:
+        rule_action = action.lower().strip()
+    
+    # Agents and IDE autosave loops repeat the same query often; serve repeats from cache
+    rule_engine = _get_rule_engine()
+    key = input_digest(code, rule_action, context, server_context, server_project, rule_engine.version)
+    result = _guidance_cache.get(key)
+    if result is None:
+        degraded = False
+        
+        def build() -> dict:
+            nonlocal degraded
+            built, degraded = _build_guidance(rule_action, code, context,
+                                              server_context=server_context, server_project=server_project)
+            return built
+        
+        # Persisted results outlive this process, so they are keyed on the rule
+        # set's fingerprint rather than the per-process version counter
+        fingerprint = rule_engine.rules_fingerprint()
+        if fingerprint is None:
+            result = build()
+        else:
+            result = cached_call("get_guidance", build, code, rule_action, context,
+                                 server_context, server_project, fingerprint,
+                                 cacheable=lambda _: not degraded)
+        # Guidance built from the engine's stand-in rows is retried, not cached
+        if not degraded:
+            _guidance_cache.put(key, result)
+    result = copy_result(result)
+    result["action"] = action
+    return result
+
+def _build_guidance(action: str, code: str, context: str, *,
+                    server_context: Optional[str], server_project: Optional[str]) -> Tuple[dict, bool]:
+    """Compute the get_guidance result, and whether the engine served fallback rules"""
     # Build project context for rule engine
     project_context = {
         "server_context": server_context,
@@ -97,59 +180,40 @@ def get_guidance(action: str, code: str = "", context: str = "",
                 })
     
     # Add legacy code analysis (keep existing code analysis logic)
-    if code:
-        code_lines = len(code.split('\n'))
-        if code_lines > 50:
-            guidance.append(f"📏 Code length ({code_lines} lines) suggests considering decomposition")
+    scan = scan_code(code) if code else None
+    if scan:
+        if scan.line_count > 50:
+            guidance.append(f"📏 Code length ({scan.line_count} lines) suggests considering decomposition")
         
         # Check for potential code smells
-        if code.count('if') > 10:
+        if scan.many_branches:
             guidance.append("🧩 High cyclomatic complexity detected - consider extracting methods")
-        if 'TODO' in code or 'FIXME' in code:
+        if scan.has_todo:
             guidance.append("📝 Address TODO/FIXME comments before finalizing")
-        if any(word in code.lower() for word in ['password', 'secret', 'key']) and any(word in code for word in ['"', "'"]):
+        if scan.possible_hardcoded_secret:
             guidance.append("🚨 Potential hardcoded secrets detected - use environment variables")
     
-    # Add server context-specific guidance
-    if server_context == 'ide-assistant':
-        guidance.append("💡 IDE Integration: Consider adding IntelliSense-friendly type hints")
-        guidance.append("🔧 IDE Integration: Structure code for better refactoring support")
-    elif server_context == 'agent':
-        guidance.append("🤖 Agent Mode: Focus on automated code generation patterns")
-        guidance.append("🔄 Agent Mode: Design for programmatic modification")
-    
-    # Add project-specific guidance if project directory is available
-    if server_project:
-        guidance.append(f"📁 Project Context: Working in {server_project}")
-        # TODO: Add project-specific configuration loading from .symmetra.toml
-    
-    # Provide default guidance if no rules matched
-    if not guidance:
-        guidance.extend([
-            "✅ No specific architectural concerns detected",
-            "🏗️ Follow established coding standards and best practices",
-            "🧪 Consider adding tests for new functionality",
-            "📝 Document complex logic and API interfaces"
-        ])
+    # Add server context- and project-specific guidance
+    guidance.extend(_server_guidance(server_context, server_project))
     
     # Determine complexity score based on number of rules and priority
-    complexity_score = "low"
+    complexity_rank = 0
     if len(relevant_rules) > 3:
-        complexity_score = "high"
-    elif len(relevant_rules) > 1:
-        complexity_score = "medium"
-    elif any(rule.get("priority") == "high" for rule in relevant_rules):
-        complexity_score = "medium"
+        complexity_rank = 2
+    elif len(relevant_rules) > 1 or any(rule.get("priority") == "high" for rule in relevant_rules):
+        complexity_rank = 1
     
+    # The cached result keeps the shared default tuples when nothing matched;
+    # copy_result hands every caller its own lists
     result = {
-        "guidance": guidance,
+        "guidance": guidance or _DEFAULT_GUIDANCE,
         "status": "advisory",
         "action": action,
-        "complexity_score": complexity_score,
-        "patterns": patterns if patterns else ["General Best Practices"],
+        "complexity_score": _COMPLEXITY_LEVELS[complexity_rank],
+        "patterns": patterns or _DEFAULT_PATTERNS,
         "rules_applied": rules_applied,
         "code_analysis": {
-            "lines_analyzed": len(code.split('\n')) if code else 0,
+            "lines_analyzed": scan.line_count if scan else 0,
             "context_provided": bool(context),
             "rules_matched": len(relevant_rules)
         }
@@ -159,7 +223,19 @@ def get_guidance(action: str, code: str = "", context: str = "",
     if external_resources:
         result["external_resources"] = external_resources
     
-    return result
+    return result, any(rule.get("fallback") for rule in relevant_rules)
+
+def reset_caches() -> None:
+    """Forget cached guidance, search and category results, including persisted ones
+    
+    Rules added through the rule engine invalidate these caches on their own;
+    call this after rules change behind the engine's back (e.g. in Supabase)
+    or after swapping the engine.
+    """
+    _guidance_cache.clear()
+    clear_disk_cache()
+    _cached_search_rules.cache_clear()
+    _cached_rule_categories.cache_clear()
 
 def search_rules(query: str, max_results: int = 5) -> dict:
     """
@@ -174,7 +250,13 @@ def search_rules(query: str, max_results: int = 5) -> dict:
         
     Returns:
         Dictionary with matching rules and their relevance scores
+        (shared with repeat queries - copy before modifying)
     """
+    return _cached_search_rules(query, max_results, _get_rule_engine().version)
+
+@lru_cache(maxsize=256)
+def _cached_search_rules(query: str, max_results: int, rules_version: int) -> dict:
+    """Compute the search_rules result"""
     rule_engine = _get_rule_engine()
     results = rule_engine.search_rules(query, max_results)
     
@@ -201,7 +283,13 @@ def list_rule_categories() -> dict:
     
     Returns all rule categories available in Symmetra's rule engine,
     helping you understand what types of guidance are available.
+    The result is shared between calls - copy before modifying.
     """
+    return _cached_rule_categories(_get_rule_engine().version)
+
+@lru_cache(maxsize=1)
+def _cached_rule_categories(rules_version: int) -> dict:
+    """Compute the list_rule_categories result"""
     rule_engine = _get_rule_engine()
     all_rules = rule_engine.list_all_rules()
     categories = {}
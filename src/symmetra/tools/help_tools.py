@@ -5,22 +5,9 @@ This module contains tools for providing help, documentation, and guidance
 on how to effectively use Symmetra's capabilities.
 """
 
-def get_symmetra_help() -> dict:
-    """
-    📚 Get comprehensive help on using Symmetra effectively
-    
-    This tool provides coding agents with detailed instructions on how to best
-    utilize Symmetra's capabilities. Use this tool when you want to understand:
-    - How to phrase requests to get the most helpful guidance
-    - What types of architectural questions Symmetra can answer
-    - Best practices for integrating Symmetra into your development workflow
-    - Examples of effective Symmetra interactions
-    
-    Returns:
-        Complete guide on Symmetra usage, capabilities, and best practices
-    """
-    return {
-        "guide": """
+from ..readonly import ReadOnlyDict
+
+_HELP_GUIDE = """
 🛡️ SYMMETRA USAGE GUIDE FOR CODING AGENTS
 
 🎯 WHAT SYMMETRA IS BEST FOR:
@@ -83,6 +70,7 @@ Symmetra is your architectural co-pilot that provides dual-mode assistance:
 - batch_analyze_issues() - Comprehensive analysis with LLM enhancement
 - get_detection_info() - Information about detection capabilities
 - get_symmetra_help() - This help guide
+- batch_execute() - Run several of the tools above in one request
 - review_code() - Structured code review prompts
 
 📋 Resources:
@@ -118,34 +106,43 @@ RESULT: Architectural patterns, security considerations, scaling strategies
 
 Remember: Symmetra is advisory, not blocking. Use the guidance to make informed
 architectural decisions while maintaining full control over your development process.
-""",
-        "quick_reference": {
-            "primary_tools": {
-                "guidance": "get_guidance(action, code, context)",
-                "detection": "detect_issues(code, file_path, language, report_type)",
-                "context_analysis": "analyze_code_context(code, line_number, language)",
-                "batch_analysis": "batch_analyze_issues(code, file_path, enable_llm_analysis)"
-            },
-            "resources": ["symmetra://rules"],
-            "prompts": ["review_code(code)"],
-            "best_for": ["architecture", "security", "performance", "scalability"],
-            "not_for": ["syntax errors", "debugging runtime issues", "package management"]
-        }
-    }
+"""
 
-def get_rules_resource() -> str:
+# The help payload never changes, so it is built once, frozen and shared by every call
+_HELP_RESULT = ReadOnlyDict({
+    "guide": _HELP_GUIDE,
+    "quick_reference": ReadOnlyDict({
+        "primary_tools": ReadOnlyDict({
+            "guidance": "get_guidance(action, code, context)",
+            "detection": "detect_issues(code, file_path, language, report_type)",
+            "context_analysis": "analyze_code_context(code, line_number, language)",
+            "batch_analysis": "batch_analyze_issues(code, file_path, enable_llm_analysis)"
+        }),
+        "resources": ("symmetra://rules",),
+        "prompts": ("review_code(code)",),
+        "best_for": ("architecture", "security", "performance", "scalability"),
+        "not_for": ("syntax errors", "debugging runtime issues", "package management")
+    })
+})
+
+def get_symmetra_help() -> dict:
     """
-    📋 Access Symmetra's comprehensive architectural governance rules
+    📚 Get comprehensive help on using Symmetra effectively
     
-    This resource provides the complete set of architectural standards and 
-    best practices that Symmetra uses to evaluate code and provide guidance.
-    Use this when you need to understand Symmetra's recommendations or 
-    when establishing coding standards for a project.
+    This tool provides coding agents with detailed instructions on how to best
+    utilize Symmetra's capabilities. Use this tool when you want to understand:
+    - How to phrase requests to get the most helpful guidance
+    - What types of architectural questions Symmetra can answer
+    - Best practices for integrating Symmetra into your development workflow
+    - Examples of effective Symmetra interactions
     
-    Contains rules for: security, performance, maintainability, scalability,
-    documentation, testing, and general architectural principles.
+    Returns:
+        Complete guide on Symmetra usage, capabilities, and best practices
+        (a shared read-only constant; copy it before modifying)
     """
-    return """
+    return _HELP_RESULT
+
+_RULES_TEXT = """
 🛡️ Symmetra Architectural Governance Rules v1.0
 
 📏 CODE ORGANIZATION & STRUCTURE
@@ -208,33 +205,30 @@ These rules are advisory and should be adapted to your specific project needs.
 Symmetra provides guidance based on these principles but never blocks development.
 """
 
-def get_review_code_prompt(code: str) -> str:
+def get_rules_resource() -> str:
     """
-    🔍 Generate comprehensive architectural code review prompt
-    
-    This prompt template guides thorough code review with focus on architectural
-    principles, security, performance, and maintainability. Use this when you
-    want to perform a detailed review of code against Symmetra's standards.
+    📋 Access Symmetra's comprehensive architectural governance rules
     
-    The generated prompt will analyze:
-    - Architectural patterns and design principles
-    - Security vulnerabilities and best practices
-    - Performance optimization opportunities  
-    - Code organization and maintainability
-    - Testing and documentation completeness
+    This resource provides the complete set of architectural standards and 
+    best practices that Symmetra uses to evaluate code and provide guidance.
+    Use this when you need to understand Symmetra's recommendations or 
+    when establishing coding standards for a project.
     
-    Args:
-        code: The code snippet or file content to review
-        
-    Returns:
-        Structured review prompt for comprehensive architectural analysis
+    Contains rules for: security, performance, maintainability, scalability,
+    documentation, testing, and general architectural principles.
     """
-    return f"""🛡️ SYMMETRA ARCHITECTURAL CODE REVIEW
+    return _RULES_TEXT
+
+# The review prompt is the code between a fixed head and tail; concatenating
+# them avoids a format() pass over the whole template on every call
+_REVIEW_CODE_HEAD = """🛡️ SYMMETRA ARCHITECTURAL CODE REVIEW
 
 Please perform a comprehensive architectural review of this code:
 
 ```
-{code}
+"""
+
+_REVIEW_CODE_TAIL = """
 ```
 
 📋 REVIEW CHECKLIST - Please analyze each area:
@@ -277,4 +271,27 @@ Please perform a comprehensive architectural review of this code:
 
 Please provide specific, actionable recommendations for each area where improvements are possible.
 Focus on architectural guidance rather than just syntax issues.
-"""
\ No newline at end of file
+"""
+
+def get_review_code_prompt(code: str) -> str:
+    """
+    🔍 Generate comprehensive architectural code review prompt
+    
+    This prompt template guides thorough code review with focus on architectural
+    principles, security, performance, and maintainability. Use this when you
+    want to perform a detailed review of code against Symmetra's standards.
+    
+    The generated prompt will analyze:
+    - Architectural patterns and design principles
+    - Security vulnerabilities and best practices
+    - Performance optimization opportunities  
+    - Code organization and maintainability
+    - Testing and documentation completeness
+    
+    Args:
+        code: The code snippet or file content to review
+        
+    Returns:
+        Structured review prompt for comprehensive architectural analysis
+    """
+    return _REVIEW_CODE_HEAD + code + _REVIEW_CODE_TAIL
@@ -543,4 +543,84 @@ def test_api_integration():
         dev_critical = len([i for i in dev_result.issues if i.severity == Severity.CRITICAL])
         
         # Production should have same or more critical issues than dev
-        assert prod_critical >= dev_critical
\ No newline at end of file
+        assert prod_critical >= dev_critical
+
+def test_code_path_is_confined_to_project(tmp_path):
+    """Test detect_issues only reads code_path files inside the server project"""
+    from src.symmetra.tools.detection_tools import detect_issues
+    
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "app.py").write_text('API_KEY = "sk-1234567890abcdef1234567890abcdef"\n')
+    (tmp_path / "outside.py").write_text("x = 1\n")
+    
+    result = detect_issues(code_path="app.py", server_project=str(project))
+    assert result["detection_results"]["file_path"] == "app.py"
+    assert result["analysis_summary"]["total_issues"] > 0
+    
+    with pytest.raises(ValueError, match="project directory"):
+        detect_issues(code_path="app.py")
+    with pytest.raises(ValueError, match="inside the project directory"):
+        detect_issues(code_path="../outside.py", server_project=str(project))
+    with pytest.raises(ValueError, match="inside the project directory"):
+        detect_issues(code_path=str(tmp_path / "outside.py"), server_project=str(project))
+    
+    # Missing and unreadable files fail the same way, without OS details
+    with pytest.raises(ValueError) as missing:
+        detect_issues(code_path="missing.py", server_project=str(project))
+    with pytest.raises(ValueError) as directory:
+        detect_issues(code_path=".", server_project=str(project))
+    assert str(missing.value) == str(directory.value)
+
+
+class _FailingDetector:
+    """Detector stand-in whose detect() always raises"""
+    
+    name = "FailingDetector"
+    
+    def should_run(self, file_path, language, context):
+        return True
+    
+    def detect(self, code, file_path, context):
+        raise RuntimeError("detector crashed")
+    
+    def get_detection_patterns(self):
+        return []
+
+
+def test_failed_analyses_are_not_cached(monkeypatch):
+    """Test an analysis where a detector raised is recomputed, not reused"""
+    from src.symmetra.tools import detection_tools
+    
+    monkeypatch.setattr(detection_tools, "detection_engine", create_detection_engine())
+    detection_tools.detection_engine.detectors.append(_FailingDetector())
+    monkeypatch.setattr(detection_tools, "_analysis_cache", type(detection_tools._analysis_cache)(maxsize=8))
+    
+    result = detection_tools._analyze("x = 1\n", "app.py", {"language": None})
+    assert result.detectors_failed == ["FailingDetector"]
+    assert len(detection_tools._analysis_cache) == 0
+
+
+def test_detect_issues_caches_only_complete_results(monkeypatch):
+    """Test detect_issues returns copies and skips caching when a detector failed"""
+    from src.symmetra.tools import detection_tools
+    
+    cache_type = type(detection_tools._detection_cache)
+    monkeypatch.setattr(detection_tools, "detection_engine", create_detection_engine())
+    monkeypatch.setattr(detection_tools, "_analysis_cache", cache_type(maxsize=8))
+    monkeypatch.setattr(detection_tools, "_detection_cache", cache_type(maxsize=8))
+    code = 'API_KEY = "sk-1234567890abcdef1234567890abcdef"\n'
+    
+    first = detection_tools.detect_issues(code, "app.py")
+    first["issues"].clear()
+    second = detection_tools.detect_issues(code, "app.py")
+    assert second["issues"]
+    assert second["analysis_summary"]["detectors_failed"] == []
+    assert len(detection_tools._detection_cache) == 1
+    
+    detection_tools.detection_engine.detectors.append(_FailingDetector())
+    result = detection_tools.detect_issues(code, "other.py")
+    assert result["analysis_summary"]["detectors_failed"] == ["FailingDetector"]
+    batch = detection_tools.batch_analyze_issues(code, "other.py")
+    assert batch["batch_analysis"]["detection_summary"]["total_issues"] > 0
+    assert len(detection_tools._detection_cache) == 1
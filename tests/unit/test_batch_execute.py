@@ -0,0 +1,39 @@
+"""
+Unit tests for the batch_execute tool
+
+Tests that each call in a batch succeeds or fails on its own.
+"""
+
+import asyncio
+
+import pytest
+
+from src.symmetra.server import batch_execute_tool
+
+
+def test_malformed_calls_fail_individually():
+    """Test bad entries get an error result while the rest of the batch runs"""
+    calls = [
+        {"tool": "get_symmetra_help"},
+        "get_symmetra_help",
+        {"tool": ["get_symmetra_help"]},
+        {"tool": "no_such_tool"},
+        {"tool": "get_symmetra_help", "args": ["unexpected"]},
+        {"tool": "get_symmetra_help", "args": {"unexpected": 1}},
+        {"tool": "get_symmetra_help", "args": None},
+    ]
+    response = asyncio.run(batch_execute_tool(calls))
+    
+    assert [result["ok"] for result in response["results"]] == [True, False, False, False, False, False, True]
+    assert response["succeeded"] == 2
+    assert response["failed"] == 5
+    assert "guide" in response["results"][0]["result"]
+    assert response["results"][1] == {"tool": None, "ok": False,
+                                      "error": "Each call must be an object with a 'tool' name"}
+    assert response["results"][3]["error"] == "Unknown tool: no_such_tool"
+
+
+def test_oversized_batches_are_rejected():
+    """Test a batch over the call limit is refused before any call runs"""
+    with pytest.raises(ValueError, match="at most 64"):
+        asyncio.run(batch_execute_tool([{"tool": "get_symmetra_help"}] * 65))
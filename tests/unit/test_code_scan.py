@@ -0,0 +1,46 @@
+"""
+Unit tests for scan_code
+
+Tests the code-smell facts shared by both guidance paths.
+"""
+
+from src.symmetra.code_scan import scan_code
+
+
+class TestScanCode:
+    """Test scan_code functionality"""
+
+    def test_clean_code(self):
+        """Test code without smells reports none"""
+        scan = scan_code("x = 1\ny = x + 1")
+        assert scan.line_count == 2
+        assert not scan.many_branches
+        assert not scan.has_todo
+        assert not scan.possible_hardcoded_password
+        assert not scan.possible_hardcoded_secret
+
+    def test_many_branches(self):
+        """Test more than ten "if"s are flagged, including in the shortest possible text"""
+        assert scan_code("if" * 11).many_branches
+        assert not scan_code("if" * 10).many_branches
+        assert scan_code("\n".join(["if x:"] * 11)).many_branches
+
+    def test_todo_markers(self):
+        """Test TODO and FIXME markers are case-sensitive"""
+        assert scan_code("# TODO: later").has_todo
+        assert scan_code("# FIXME").has_todo
+        assert not scan_code("# todo").has_todo
+
+    def test_hardcoded_secrets_need_a_string_literal(self):
+        """Test secret keywords only count when the code has a string literal"""
+        assert not scan_code("Password = get_password()").possible_hardcoded_password
+        scan = scan_code('PASSWORD = "hunter2"')
+        assert scan.possible_hardcoded_password
+        assert scan.possible_hardcoded_secret
+
+    def test_secret_keywords(self):
+        """Test "secret" and "key" are secrets but not passwords"""
+        for code in ("API_KEY = 'abc'", "client_secret = 'abc'"):
+            scan = scan_code(code)
+            assert scan.possible_hardcoded_secret
+            assert not scan.possible_hardcoded_password
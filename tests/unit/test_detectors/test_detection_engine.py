@@ -7,7 +7,7 @@ Tests the coordination of multiple detectors and result prioritization.
 import pytest
 from unittest.mock import Mock, MagicMock
 from src.symmetra.detectors.engine import DetectionEngine
-from src.symmetra.detectors.base import Detector, DetectedIssue, Severity, IssueType
+from src.symmetra.detectors.base import Detector, DetectedIssue, Severity, IssueType, parse_python
 
 
 class MockDetector(Detector):
@@ -76,6 +76,13 @@ class TestDetectionEngine:
                 assert result.language == expected_language
             # Note: content-based detection tested separately
     
+    def test_language_detection_extension_edge_cases(self):
+        """Test extensions are matched case-insensitively and only at the end of the path"""
+        assert self.engine._detect_language("SRC/MAIN.PY", "") == "python"
+        assert self.engine._detect_language("scripts/deploy.sh", "") == "bash"
+        assert self.engine._detect_language("lib.c/readme", "") is None
+        assert self.engine._detect_language("Makefile", "") is None
+    
     def test_content_based_language_detection(self):
         """Test language detection from code content"""
         test_cases = [
@@ -372,6 +379,7 @@ class TestDetectionEngine:
         
         assert "WorkingDetector" in result.detectors_run
         assert "FailingDetector" not in result.detectors_run
+        assert result.detectors_failed == ["FailingDetector"]
         # Should still produce valid result
         assert result.status in ["clean", "issues_found", "high_issues", "critical_issues"]
     
@@ -419,6 +427,18 @@ class TestDetectionEngine:
         assert result.status == "clean"
         assert len(result.issues) == 0
     
+    def test_blank_code_skips_detectors(self):
+        """Test blank code is analyzed without running any detector"""
+        result = self.engine.analyze_code("  \n\t\n", "blank.py")
+        
+        assert result.detectors_run == []
+        assert result.status == "clean"
+        assert self.engine.get_statistics()["blank_inputs_skipped"] == 1
+        
+        result = self.engine.analyze_code("x = 1", "small.py")
+        assert result.detectors_run == ["MockDetector1", "MockDetector2"]
+        assert self.engine.get_statistics()["blank_inputs_skipped"] == 1
+    
     def test_large_code_handling(self):
         """Test handling of large code files"""
         large_code = "\n".join([f"line {i}" for i in range(1000)])
@@ -426,4 +446,19 @@ class TestDetectionEngine:
         
         assert result.total_lines == 1000
         assert result.analysis_time_ms > 0
-        # Should complete without errors
\ No newline at end of file
+        # Should complete without errors
+
+class TestParsePython:
+    """Test the shared Python parse cache"""
+
+    def test_same_code_reuses_tree(self):
+        """Test repeated parses of the same source return the cached tree"""
+        code = "def cached_parse_example():\n    return 1\n"
+        assert parse_python(code) is parse_python(code)
+        assert parse_python(code) is not parse_python(code + "\n")
+
+    def test_syntax_error_is_raised(self):
+        """Test invalid source raises SyntaxError every time"""
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                parse_python("def broken(:\n")
@@ -0,0 +1,144 @@
+"""
+Unit tests for the optional disk cache
+
+diskcache is optional, so these cover the keying, the pass-through
+behaviour when persistence is off, and persistence against an in-memory
+stand-in for diskcache.Cache.
+"""
+
+import sys
+import types
+
+import pytest
+from src.symmetra import disk_cache
+from src.symmetra.disk_cache import cached_call, disk_cache_key, get_disk_cache
+from src.symmetra.rules_engine import KeywordRuleEngine
+from src.symmetra.tools import guidance_tools
+
+
+class _MemoryCache(dict):
+    """The slice of diskcache.Cache that disk_cache uses, kept in memory"""
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+
+
+@pytest.fixture
+def persisted(monkeypatch, tmp_path):
+    """Turn persistence on, backed by _MemoryCache"""
+    monkeypatch.setitem(sys.modules, "diskcache", types.SimpleNamespace(Cache=_MemoryCache))
+    monkeypatch.setenv("SYMMETRA_CACHE_DIR", str(tmp_path))
+    return get_disk_cache()
+
+
+@pytest.fixture
+def keyword_engine():
+    """Run guidance against the in-memory keyword engine with empty caches"""
+    saved_engine = guidance_tools._rule_engine
+    guidance_tools._rule_engine = KeywordRuleEngine()
+    guidance_tools.reset_caches()
+    yield guidance_tools._rule_engine
+    guidance_tools._rule_engine = saved_engine
+    guidance_tools.reset_caches()
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    """Re-read SYMMETRA_CACHE_DIR for each test"""
+    monkeypatch.delenv("SYMMETRA_CACHE_DIR", raising=False)
+    get_disk_cache.cache_clear()
+    yield
+    get_disk_cache.cache_clear()
+
+
+def test_key_covers_tool_code_params_and_version(monkeypatch):
+    key = disk_cache_key("detect_issues", "x = 1", "a.py")
+    assert key == disk_cache_key("detect_issues", "x = 1", "a.py")
+    assert key != disk_cache_key("get_guidance", "x = 1", "a.py")
+    assert key != disk_cache_key("detect_issues", "x = 2", "a.py")
+    assert key != disk_cache_key("detect_issues", "x = 1", "b.py")
+
+    monkeypatch.setattr(disk_cache, "__version__", "999.0")
+    assert key != disk_cache_key("detect_issues", "x = 1", "a.py")
+
+
+def test_cached_call_computes_when_persistence_is_off():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"ok": True}
+
+    assert get_disk_cache() is None
+    assert cached_call("detect_issues", compute, "x = 1") == {"ok": True}
+    assert cached_call("detect_issues", compute, "x = 1") == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_cached_call_persists_results(persisted):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"ok": True}
+
+    assert cached_call("detect_issues", compute, "x = 1") == {"ok": True}
+    assert cached_call("detect_issues", compute, "x = 1") == {"ok": True}
+    assert len(calls) == 1
+    assert len(persisted) == 1
+
+    disk_cache.clear_disk_cache()
+    assert len(persisted) == 0
+
+
+def test_persisted_guidance_follows_rule_changes(persisted, keyword_engine):
+    assert guidance_tools.get_guidance("tune kafka", code="y = 1")["rules_applied"] == []
+
+    keyword_engine.add_rule({
+        "rule_id": "kafka-rule",
+        "title": "Kafka Topics",
+        "guidance": "Partition topics by key",
+        "keywords": ["kafka"],
+        "contexts": ["agent"],
+        "priority": "medium",
+        "category": "streaming",
+    })
+    assert guidance_tools.get_guidance("tune kafka", code="y = 1")["rules_applied"] == ["Kafka Topics"]
+
+
+def test_reset_caches_clears_persisted_guidance(persisted, keyword_engine):
+    guidance_tools.get_guidance("tune kafka", code="y = 1")
+    assert len(persisted) == 1
+
+    guidance_tools.reset_caches()
+    assert len(persisted) == 0
+
+
+def test_cached_call_skips_rejected_results(persisted):
+    assert cached_call("detect_issues", lambda: {"ok": False}, "x = 1",
+                       cacheable=lambda result: result["ok"]) == {"ok": False}
+    assert len(persisted) == 0
+
+
+def test_persisted_guidance_survives_engine_restart(persisted, keyword_engine):
+    first = guidance_tools.get_guidance("tune kafka", code="y = 1")
+    assert len(persisted) == 1
+
+    # A restarted server builds a new engine with the same rules and finds the entry
+    guidance_tools._rule_engine = KeywordRuleEngine()
+    guidance_tools._guidance_cache.clear()
+    assert guidance_tools.get_guidance("tune kafka", code="y = 1") == first
+    assert len(persisted) == 1
+
+
+def test_fallback_guidance_is_not_persisted(persisted, keyword_engine, monkeypatch):
+    find_relevant_rules = keyword_engine.find_relevant_rules
+    monkeypatch.setattr(keyword_engine, "find_relevant_rules", lambda **kwargs: [
+        dict(rule, fallback=True) for rule in find_relevant_rules(**kwargs)
+    ])
+    guidance_tools.get_guidance("tune database indexes", code="y = 1")
+    assert len(persisted) == 0
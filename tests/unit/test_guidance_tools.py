@@ -0,0 +1,101 @@
+"""
+Unit tests for the guidance tool
+
+Tests guidance assembly with the keyword rule engine and action-only caching.
+"""
+
+from src.symmetra.rules_engine import KeywordRuleEngine
+from src.symmetra.tools import guidance_tools
+
+
+class TestGetGuidance:
+    """Test get_guidance functionality"""
+
+    def setup_method(self):
+        """Use the in-memory keyword engine and start from an empty cache"""
+        self._saved_engine = guidance_tools._rule_engine
+        guidance_tools._rule_engine = KeywordRuleEngine()
+        guidance_tools.reset_caches()
+
+    def teardown_method(self):
+        """Restore the module-level engine"""
+        guidance_tools._rule_engine = self._saved_engine
+        guidance_tools.reset_caches()
+
+    def test_server_context_guidance(self):
+        """Test server context and project add their guidance lines"""
+        result = guidance_tools.get_guidance("design api", server_context="agent", server_project="/tmp/app")
+        assert "🤖 Agent Mode: Focus on automated code generation patterns" in result["guidance"]
+        assert result["guidance"][-1] == "📁 Project Context: Working in /tmp/app"
+
+    def test_results_are_cached_copies(self):
+        """Test repeated queries hit the cache and return independent copies"""
+        first = guidance_tools.get_guidance("build mcp tool with vector database")
+        first["guidance"].append("mutated")
+        first["code_analysis"]["rules_matched"] = -1
+
+        second = guidance_tools.get_guidance("build mcp tool with vector database")
+        assert "mutated" not in second["guidance"]
+        assert second["code_analysis"]["rules_matched"] > 0
+        assert len(guidance_tools._guidance_cache) == 1
+
+    def test_code_is_part_of_cache_key(self):
+        """Test queries that differ only in code are cached separately"""
+        result = guidance_tools.get_guidance("refactor", code="x = 1\n# TODO: fix")
+        assert result["code_analysis"]["lines_analyzed"] == 2
+        assert "📝 Address TODO/FIXME comments before finalizing" in result["guidance"]
+
+        result = guidance_tools.get_guidance("refactor", code="x = 1")
+        assert result["code_analysis"]["lines_analyzed"] == 1
+        assert "📝 Address TODO/FIXME comments before finalizing" not in result["guidance"]
+        assert len(guidance_tools._guidance_cache) == 2
+
+    def test_short_actions_share_normalized_entry(self):
+        """Test short action-only queries differing in case and padding share one entry"""
+        first = guidance_tools.get_guidance("Add Auth")
+        second = guidance_tools.get_guidance("  add auth ")
+        assert first["action"] == "Add Auth"
+        assert second["action"] == "  add auth "
+        assert first["rules_applied"] == second["rules_applied"]
+        assert len(guidance_tools._guidance_cache) == 1
+
+    def test_added_rules_invalidate_caches(self):
+        """Test cached search, category and guidance results refresh when a rule is added"""
+        assert guidance_tools.search_rules("kafka")["total_results"] == 0
+        assert guidance_tools.get_guidance("tune kafka")["rules_applied"] == []
+        categories = guidance_tools.list_rule_categories()["total_categories"]
+
+        guidance_tools._rule_engine.add_rule({
+            "rule_id": "kafka-rule",
+            "title": "Kafka Topics",
+            "guidance": "Partition topics by key",
+            "keywords": ["kafka"],
+            "contexts": ["agent"],
+            "priority": "medium",
+            "category": "streaming",
+        })
+        assert guidance_tools.search_rules("kafka")["total_results"] == 1
+        assert guidance_tools.list_rule_categories()["total_categories"] == categories + 1
+        assert guidance_tools.get_guidance("tune kafka")["rules_applied"] == ["Kafka Topics"]
+
+    def test_server_arguments_stay_positional(self):
+        """Test existing positional callers can still pass server context and project"""
+        result = guidance_tools.get_guidance("design api", "", "", "agent", "/tmp/app")
+        assert result["guidance"][-1] == "📁 Project Context: Working in /tmp/app"
+
+    def test_fallback_rules_are_not_cached(self):
+        """Test guidance built from an engine's fallback rows is recomputed on the next call"""
+        engine = guidance_tools._rule_engine
+        find_relevant_rules = engine.find_relevant_rules
+
+        def fallback_rules(**kwargs):
+            return [dict(rule, fallback=True) for rule in find_relevant_rules(**kwargs)]
+
+        engine.find_relevant_rules = fallback_rules
+        result = guidance_tools.get_guidance("build mcp tool with vector database")
+        assert result["rules_applied"]
+        assert len(guidance_tools._guidance_cache) == 0
+
+        engine.find_relevant_rules = find_relevant_rules
+        guidance_tools.get_guidance("build mcp tool with vector database")
+        assert len(guidance_tools._guidance_cache) == 1
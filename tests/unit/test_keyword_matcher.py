@@ -0,0 +1,57 @@
+"""
+Unit tests for KeywordMatcher
+
+Tests that the single-pass matcher reports exactly the categories a
+per-keyword substring scan would.
+"""
+
+import random
+
+import pytest
+from src.symmetra.keyword_matcher import KeywordMatcher
+
+
+CATEGORIES = {
+    "auth": ["auth", "login", "user", "token"],
+    "database": ["database", "db", "data"],
+    "api": ["api", "rest", "endpoint"],
+    "architecture": ["structure", "design"],
+    "complexity:authentication": ["authentication"],
+}
+
+
+def naive_match(text):
+    """Reference implementation: one substring scan per keyword"""
+    return {category for category, words in CATEGORIES.items() if any(word in text for word in words)}
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher functionality"""
+
+    def setup_method(self):
+        """Set up test instance"""
+        self.matcher = KeywordMatcher(CATEGORIES)
+
+    def test_no_match(self):
+        """Test text without keywords yields no categories"""
+        assert self.matcher.match("") == set()
+        assert self.matcher.match("hello world") == set()
+
+    def test_prefix_keywords_share_position(self):
+        """Test a keyword that is a prefix of a longer one is still reported"""
+        assert self.matcher.match("authentication") == {"auth", "complexity:authentication"}
+        assert self.matcher.match("database") == {"database"}
+
+    def test_overlapping_keywords(self):
+        """Test keywords overlapping each other are all reported"""
+        # "rest" and "structure" overlap inside "restructure"
+        assert self.matcher.match("restructure") == {"api", "architecture"}
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_substring_semantics(self, seed):
+        """Test results equal a per-keyword substring scan on random text"""
+        rng = random.Random(seed)
+        vocabulary = [word for words in CATEGORIES.values() for word in words] + ["the", "x", "re", "s"]
+        for _ in range(300):
+            text = rng.choice(["", " "]).join(rng.choice(vocabulary) for _ in range(rng.randint(0, 6)))
+            assert self.matcher.match(text) == naive_match(text)
@@ -0,0 +1,117 @@
+"""
+Unit tests for KeywordRuleEngine
+
+Tests bootstrap rule loading, keyword scoring and rule management.
+"""
+
+import pytest
+from src.symmetra.rules_engine import KeywordRuleEngine
+
+
+class TestKeywordRuleEngine:
+    """Test KeywordRuleEngine functionality"""
+
+    def setup_method(self):
+        """Set up test instance"""
+        self.engine = KeywordRuleEngine()
+
+    def test_bootstrap_rules_loaded(self):
+        """Test bootstrap rules are available and returned as plain dicts"""
+        rules = self.engine.list_all_rules()
+        assert len(rules) > 0
+        assert all(isinstance(rule, dict) for rule in rules)
+        assert self.engine.get_rule_by_id("vector-db-choice") is not None
+
+    def test_engines_do_not_share_added_rules(self):
+        """Test add_rule does not leak into other engine instances"""
+        rule = {
+            "rule_id": "custom-rule",
+            "title": "Custom Rule",
+            "guidance": "Custom guidance",
+            "keywords": ["custom"],
+            "contexts": ["agent"],
+            "priority": "low",
+            "category": "ux",
+        }
+        assert self.engine.add_rule(rule) is True
+        assert self.engine.get_rule_by_id("custom-rule") is not None
+        assert KeywordRuleEngine().get_rule_by_id("custom-rule") is None
+
+    def test_relevance_scoring(self):
+        """Test keyword matches are scored and boosted by priority and server context"""
+        results = self.engine.find_relevant_rules(
+            "build mcp tool with vector database",
+            project_context={"server_context": "agent"}
+        )
+
+        scores = {rule["rule_id"]: rule["relevance_score"] for rule in results}
+        # 2 of 8 keywords ("vector", "database"), high priority, agent context
+        assert scores["vector-db-choice"] == pytest.approx(2 / 8 * 1.5 * 1.3)
+        assert [rule["relevance_score"] for rule in results] == sorted(scores.values(), reverse=True)
+
+    def test_context_filter(self):
+        """Test rules outside the requested context are skipped"""
+        results = self.engine.find_relevant_rules("project structure modules", context="agent")
+        assert all("agent" in rule["contexts"] for rule in results)
+
+    def test_added_rule_is_scored(self):
+        """Test rules added after the first query are picked up by scoring"""
+        self.engine.find_relevant_rules("warm up")
+        self.engine.add_rule({
+            "rule_id": "queue-rule",
+            "title": "Queue Design",
+            "guidance": "Use a durable queue",
+            "keywords": ["queue"],
+            "contexts": ["agent"],
+            "priority": "high",
+            "category": "architecture",
+        })
+        results = self.engine.find_relevant_rules("design a queue")
+        assert results[0]["rule_id"] == "queue-rule"
+
+    def test_replacing_rules(self):
+        """Test assigning a new rule list resets scoring"""
+        self.engine.find_relevant_rules("vector database")
+        self.engine.rules = []
+        assert self.engine.find_relevant_rules("vector database") == []
+
+    def test_search_rules_field_weights(self):
+        """Test search scores title, guidance, keyword and rationale hits"""
+        results = self.engine.search_rules("Vector")
+        top = results[0]
+        assert top["rule_id"] == "vector-db-choice"
+        # title (3) + guidance (2) + keywords "vector", "pgvector" (2) + rationale (1)
+        assert top["search_score"] == 8
+
+    def test_search_rules_sees_added_rules(self):
+        """Test rules added after a search are searchable"""
+        assert self.engine.search_rules("kafka") == []
+        self.engine.add_rule({
+            "rule_id": "kafka-rule",
+            "title": "Kafka Topics",
+            "guidance": "Partition topics by key",
+            "keywords": ["kafka"],
+            "contexts": ["agent"],
+            "priority": "medium",
+            "category": "architecture",
+        })
+        assert self.engine.search_rules("kafka")[0]["rule_id"] == "kafka-rule"
+
+    def test_fingerprint_identifies_rule_set(self):
+        """Test fingerprints match across engines with the same rules and follow changes"""
+        fingerprint = self.engine.rules_fingerprint()
+        assert fingerprint == KeywordRuleEngine().rules_fingerprint()
+
+        rule = {
+            "rule_id": "custom-rule",
+            "title": "Custom Rule",
+            "guidance": "Custom guidance",
+            "keywords": ["custom"],
+            "contexts": ["agent"],
+            "priority": "low",
+            "category": "ux",
+        }
+        other = KeywordRuleEngine()
+        other.add_rule(dict(rule, rule_id="other-rule"))
+        self.engine.add_rule(rule)
+        assert self.engine.rules_fingerprint() not in (fingerprint, other.rules_fingerprint())